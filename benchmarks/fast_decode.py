@@ -0,0 +1,79 @@
+"""Measure how many items a second are parsed with betterproto and with the fast decoders.
+
+Run it from the root of the repo, e.g. ``python benchmarks/fast_decode.py --items 5000 --runs 5``. The items are
+synthetic but have the fields and attributes a skin with stickers has.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import time
+
+from steam.ext.csgo import use_fast_decoders
+from steam.ext.csgo.protobufs import base
+
+
+def make_items(count: int) -> list[bytes]:
+    paint = [
+        base.ItemAttribute(def_index=6, value_bytes=struct.pack("<f", 44)),
+        base.ItemAttribute(def_index=7, value_bytes=struct.pack("<f", 661)),
+        base.ItemAttribute(def_index=8, value_bytes=struct.pack("<f", 0.07)),
+    ]
+    stickers = [
+        base.ItemAttribute(def_index=113 + slot, value_bytes=struct.pack("<I", 5000)) for slot in range(4, 24, 4)
+    ]
+    return [
+        bytes(
+            base.Item(
+                id=30_000_000_000 + id,
+                account_id=123_456_789,
+                inventory=id,
+                def_index=7,
+                quantity=1,
+                quality=4,
+                flags=0,
+                origin=8,
+                custom_name="name" if id % 10 == 0 else "",
+                attribute=[*paint, *stickers],
+                equipped_state=[base.ItemEquipped(new_class=2, new_slot=14)],
+                rarity=5,
+            )
+        )
+        for id in range(count)
+    ]
+
+
+def items_per_second(items: list[bytes], runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for data in items:
+            base.Item().parse(data)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    views = [memoryview(data) for data in items]
+    results: dict[str, float] = {}
+    for fast in (False, True):
+        use_fast_decoders(fast)
+        for kind, buffers in (("bytes", items), ("memoryview", views)):
+            results[f"{'fast' if fast else 'betterproto'} ({kind})"] = items_per_second(buffers, args.runs)
+
+    baseline = results["betterproto (bytes)"]
+    for name, rate in results.items():
+        print(f"{name:<25} {rate:12,.0f} items/s {rate / baseline:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Measure how long ``import steam.ext.csgo`` takes with ``python -X importtime``.
+
+Run it from the root of the repo, e.g. ``python benchmarks/import_time.py --runs 10 --max-ms 400``, it exits with 1 if
+the median import takes longer than ``--max-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = ("steam.ext.csgo", "steam.ext.csgo.protobufs", "steam.ext.csgo.state")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """The cumulative import time in microseconds of every module imported by ``import module`` in a new process."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, help="fail if the median import of steam.ext.csgo takes longer")
+    args = parser.parse_args()
+
+    runs = [import_times("steam.ext.csgo") for _ in range(args.runs)]
+    for module in MODULES:
+        median = statistics.median(run.get(module, 0) for run in runs) / 1000
+        print(f"{module:<30} {median:8.1f}ms")
+
+    total = statistics.median(run["steam.ext.csgo"] for run in runs) / 1000
+    if args.max_ms is not None and total > args.max_ms:
+        print(f"steam.ext.csgo took {total:.1f}ms to import, more than {args.max_ms}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
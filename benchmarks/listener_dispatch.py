@@ -0,0 +1,79 @@
+"""Measure how long dispatching a GC message takes with 10 to 100,000 other listeners pending.
+
+Run it from the root of the repo, e.g. ``python benchmarks/listener_dispatch.py --messages 20000``. The listeners wait
+for a message that never arrives, like the responses to a large batch of requests, while an unrelated message with a
+listener of its own is dispatched repeatedly. It exits with 1 if the time per message grows by more than
+``--max-ratio`` between the smallest and the largest number of pending listeners.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from steam._gc.state import GCState
+from steam.app import CSGO
+from steam.ext.csgo.protobufs import cstrike
+from steam.protobufs.client_server_2 import CMsgGcClientFromGC
+
+PENDING = (10, 100, 1_000, 10_000, 100_000)
+
+
+class BenchState:
+    """Just enough of a GCState to dispatch messages, the message has no parser so only listeners see it."""
+
+    gc_parsers: dict[Any, Any] = {}
+    gc_parser_emsgs = frozenset[int]()
+    gc_instrumentation = None
+    parse_gc_message = GCState.parse_gc_message
+    _parse_gc_message = GCState._parse_gc_message
+    gc_wait_for = GCState.gc_wait_for
+    _remove_gc_listener = GCState._remove_gc_listener
+
+    def __init__(self) -> None:
+        self.gc_listeners: dict[Any, Any] = {}
+        self.client = SimpleNamespace(_APP=CSGO, _GC_APPS={CSGO.id: CSGO})
+
+
+async def time_dispatch(pending: int, messages: int) -> float:
+    state: Any = BenchState()
+    waiting = [state.gc_wait_for(cstrike.Client2GcEconPreviewDataBlockResponse, app_id=CSGO.id) for _ in range(pending)]
+    payload = bytes(cstrike.PlayersProfile(request_id=1))
+    msg = CMsgGcClientFromGC(appid=CSGO.id, msgtype=int.from_bytes(payload[:4], "little"), payload=payload)
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        future = state.gc_wait_for(cstrike.PlayersProfile, app_id=CSGO.id)
+        await state.parse_gc_message(msg)
+        assert future.done()
+        await asyncio.sleep(0)  # let its done callback remove the listener
+    elapsed = time.perf_counter() - start
+
+    for future in waiting:
+        future.cancel()
+    return elapsed / messages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    args = parser.parse_args()
+
+    results = {pending: asyncio.run(time_dispatch(pending, args.messages)) for pending in PENDING}
+    for pending, seconds in results.items():
+        print(f"{pending:>8,} pending listeners {seconds * 1e6:8.2f}µs/message")
+
+    ratio = results[PENDING[-1]] / results[PENDING[0]]
+    if ratio > args.max_ratio:
+        print(f"dispatching got {ratio:.1f}x slower with more listeners pending", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
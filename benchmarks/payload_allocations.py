@@ -0,0 +1,88 @@
+"""Measure the memory allocated to parse a GC message and its items with and without copying the payload.
+
+Run it from the root of the repo, e.g. ``python benchmarks/payload_allocations.py --items 1000``. ``copy`` parses
+``payload[4:]`` like :meth:`GCState.parse_gc_message` does, ``memoryview`` parses ``memoryview(payload)[4:]``. Memory
+is traced with :mod:`tracemalloc` while an ``SOUpdateMultiple`` and a ``SOCacheSubscribed`` are parsed along with each
+of the items in them.
+
+Parsing from a memoryview avoids copying the payload but every bytes field parsed from it is a memoryview slice, these
+are bigger than the small bytes objects they replace and keep the whole payload alive, so more memory is retained.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import tracemalloc
+from typing import Any
+
+from steam.app import CSGO
+from steam.ext.csgo.protobufs import base, sdk
+from steam.protobufs import GCProtobufMessage
+
+
+def make_items(count: int) -> list[bytes]:
+    attributes = [
+        base.ItemAttribute(def_index=6, value_bytes=struct.pack("<f", 44)),
+        base.ItemAttribute(def_index=7, value_bytes=struct.pack("<f", 661)),
+        base.ItemAttribute(def_index=8, value_bytes=struct.pack("<f", 0.07)),
+    ]
+    return [
+        bytes(base.Item(id=30_000_000_000 + id, account_id=1, def_index=7, quality=4, attribute=attributes))
+        for id in range(count)
+    ]
+
+
+def object_data(msg: Any) -> list[Any]:
+    if isinstance(msg, sdk.MultipleObjects):
+        return [obj.object_data for obj in msg.objects_modified]
+    return [data for objects in msg.objects for data in objects.object_data]
+
+
+def measure(payload: bytes, *, copy: bool) -> tuple[int, int, int]:
+    """The bytes allocated at peak parsing ``payload``, at peak parsing it and its items and still held afterwards."""
+    emsg = int.from_bytes(payload[:4], "little") & ~0x80000000
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        msg = GCProtobufMessage().parse(payload[4:] if copy else memoryview(payload)[4:], emsg, CSGO.id)
+        _, message_peak = tracemalloc.get_traced_memory()
+        items = [base.Item().parse(data) for data in object_data(msg)]
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del msg, items
+    return message_peak - before, peak - before, retained - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    owner = sdk.IDOwner(type=1, id=76561198000000000)
+    messages = {
+        "SOUpdateMultiple": sdk.MultipleObjects(
+            objects_modified=[sdk.MultipleObjectsSingleObject(type_id=1, object_data=data) for data in items],
+            owner_soid=owner,
+        ),
+        "SOCacheSubscribed": sdk.SOCacheSubscribed(
+            objects=[sdk.CacheSubscribedSubscribedType(type_id=1, object_data=items)], owner_soid=owner
+        ),
+    }
+    for name, msg in messages.items():
+        payload = bytes(msg)
+        print(f"{name} ({len(payload):,} bytes, {args.items:,} items)")
+        print(f"  {'':<10}{'message peak':>17}{'with items peak':>17}{'retained':>17}")
+        for copy in (True, False):
+            measure(payload, copy=copy)  # warm up any caches so they aren't counted
+            results = measure(payload, copy=copy)
+            print(f"  {'copy' if copy else 'memoryview':<10}" + "".join(f"{result:>17,}" for result in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
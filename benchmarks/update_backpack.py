@@ -0,0 +1,125 @@
+"""Measure how long decoding a synthetic SO cache and merging it with :meth:`GCState.update_backpack` takes.
+
+Run it from the root of the repo, e.g. ``python benchmarks/update_backpack.py --items 5000 --runs 10 --max-ms 200``.
+The cache has caskets, items in those caskets and items with paint, stickers and names in the backpack, each run
+is decoded and merged again like a cache resubscription is. The decoding and the merge are timed separately, it
+exits with 1 if the median merge takes longer than ``--max-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import struct
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from steam.ext.csgo import use_fast_decoders
+from steam.ext.csgo.attributes import DecodedItem, decode_items
+from steam.ext.csgo.backpack import Backpack, BackpackItem
+from steam.ext.csgo.casket_store import CasketItemStore
+from steam.ext.csgo.protobufs import base
+from steam.ext.csgo.state import GCState
+from steam.types.id import AssetID
+
+CASKETS = 10
+FIRST_ID = 30_000_000_000
+
+
+def make_cache(count: int) -> list[bytes]:
+    caskets = [FIRST_ID + id for id in range(CASKETS)]
+    gc_items: list[base.Item] = []
+    for id in range(FIRST_ID, FIRST_ID + count):
+        attributes = [
+            base.ItemAttribute(def_index=6, value_bytes=struct.pack("<f", 44)),
+            base.ItemAttribute(def_index=7, value_bytes=struct.pack("<f", 661)),
+            base.ItemAttribute(def_index=8, value_bytes=struct.pack("<f", 0.07)),
+            *(base.ItemAttribute(def_index=113 + slot, value_bytes=struct.pack("<I", 5000)) for slot in (4, 8)),
+        ]
+        if id in caskets:
+            def_index = 1201
+            attributes = [base.ItemAttribute(def_index=270, value_bytes=struct.pack("<I", 100))]
+        elif id % 5 == 0:  # every fifth item is in a casket
+            def_index = 7
+            casket_id = caskets[id % CASKETS]
+            attributes += [
+                base.ItemAttribute(def_index=272, value_bytes=struct.pack("<I", casket_id & 0xFFFFFFFF)),
+                base.ItemAttribute(def_index=273, value_bytes=struct.pack("<I", casket_id >> 32)),
+            ]
+        else:
+            def_index = 7
+            if id % 10 == 1:
+                attributes.append(base.ItemAttribute(def_index=111, value_bytes=b"\x00\x04name"))
+        gc_items.append(
+            base.Item(
+                id=id,
+                account_id=1,
+                inventory=id & 0xFFFF,
+                def_index=def_index,
+                quantity=1,
+                quality=4,
+                attribute=attributes,
+            )
+        )
+    return [bytes(gc_item) for gc_item in gc_items]
+
+
+def make_state(decoded: list[DecodedItem]) -> Any:
+    backpack = Backpack.__new__(Backpack)
+    backpack.items = []  # type: ignore
+    backpack._indices = {}
+    state = SimpleNamespace(
+        client=SimpleNamespace(wait_until_ready=lambda: asyncio.sleep(0)),
+        backpack=backpack,
+        waiting_for_casket_items={},
+        add_item_to_backpack=backpack._add_item,
+        fetch_created_item=None,  # nothing is taken out of a casket
+    )
+    state.casket_items = CasketItemStore(state)  # type: ignore
+    for gc_item, attributes, _ in decoded:
+        if attributes.casket_id is None:
+            item = BackpackItem.__new__(BackpackItem)
+            item.id = AssetID(gc_item.id)
+            backpack._add_item(item)
+    return state
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, help="fail if the median run takes longer")
+    parser.add_argument("--betterproto", action="store_true", help="decode with betterproto not the fast decoders")
+    args = parser.parse_args()
+    use_fast_decoders(not args.betterproto)
+
+    object_data = make_cache(args.items)
+    decoded = decode_items(object_data)
+    state = make_state(decoded)
+    asyncio.run(GCState.update_backpack(state, *decoded))  # the first run turns the caskets into Caskets
+
+    decoding: list[float] = []
+    merging: list[float] = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        decoded = decode_items(object_data)
+        decoding.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        asyncio.run(GCState.update_backpack(state, *decoded))
+        merging.append(time.perf_counter() - start)
+
+    for name, runs in (("decode_items", decoding), ("update_backpack", merging)):
+        median = statistics.median(runs) * 1000
+        print(f"{name:<16} {args.items:,} items: {median:8.1f}ms median, {median * 1000 / args.items:7.2f}µs/item")
+    median = statistics.median(merging) * 1000
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"update_backpack took {median:.1f}ms, more than {args.max_ms}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
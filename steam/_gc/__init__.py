@@ -8,4 +8,6 @@ Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See
 """
 
 from .client import *
+from .metrics import *
+from .scheduler import *
 from .state import *
@@ -18,6 +18,7 @@ from ..trade import Inventory, Item
 from ..types.id import AppID
 from ..user import ClientUser as ClientUser_
 from ..utils import cached_property
+from .scheduler import SendPriority
 from .state import GCState
 
 __all__ = ("Client",)
@@ -41,6 +42,7 @@ class Client(Client_):
     _ClientUserCls: ClassVar[type[ClientUser]] = ClientUser  # ideally one day this will be a generic
     _GC_BASES: Final[tuple[type[GCState], ...]] = ()
     _GC_APPS: Final[Mapping[AppID, App]] = {}
+    _GC_STATE: ClassVar[type[GCState] | None] = None  # the composed state, made once per subclass
     user: cached_property[Self, ClientUser]  # type: ignore
 
     def __init_subclass__(cls) -> None:
@@ -55,6 +57,12 @@ class Client(Client_):
                 )
             ),
         )
+        # a subclass that narrows its state, e.g. `_state: MyGCState`, replaces the state it's a subclass of
+        cls._GC_BASES = tuple(  # type: ignore
+            base
+            for base in cls._GC_BASES
+            if not any(other is not base and issubclass(other, base) for other in cls._GC_BASES)
+        )
         cls._GC_APPS = {  # type: ignore
             base._APP.id: base._APP for base in cls._GC_BASES
         }  # fmt: skip
@@ -67,16 +75,25 @@ class Client(Client_):
                 raise TypeError(f"Method(s) {', '.join(overridden_methods)} conflict inside of the state subclasses")
             seen_methods |= base.__dict__.keys()
 
+        # composing the state runs GCState.__init_subclass__ which builds gc_parsers, so only do it once
+        cls._GC_STATE = type("GCState", cls._GC_BASES, {}) if cls._GC_BASES else None
+
     def _get_state(self, **options: Any) -> GCState:
-        return type("GCState", self._GC_BASES, {})(self, **options)
+        assert self._GC_STATE is not None
+        return self._GC_STATE(self, **options)
 
     async def _ping_gc(self) -> None:
+        if not self._state.gc_heartbeat:
+            return  # something else, like a Fleet, is sending our heartbeats
         await self._state.login_complete.wait()
         while not self.is_closed():
-            for base in self._GC_BASES:
-                await self._state.ws.send_gc_message(base._get_gc_message(self._state))
+            await self._send_gc_heartbeat()
             await asyncio.sleep(self._GC_HEART_BEAT)
 
+    async def _send_gc_heartbeat(self) -> None:
+        for base in self._GC_BASES:
+            await self._state.send_gc_message(base._get_gc_message(self._state), priority=SendPriority.Critical)
+
     @overload
     async def login(
         self,
@@ -101,6 +118,10 @@ class Client(Client_):
     async def login(self, *args: Any, **kwargs: Any) -> None:
         await asyncio.gather(super().login(*args, **kwargs), self._ping_gc())
 
+    async def close(self) -> None:
+        self._state.gc_sender.close()
+        await super().close()
+
     async def _handle_ready(self) -> None:
         us = self._state._original_client_user_msg
         assert us is not None
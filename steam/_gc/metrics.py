@@ -0,0 +1,221 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Final, Literal, TypeAlias
+
+__all__ = (
+    "GCInstrumentation",
+    "GCMetrics",
+)
+
+Stage: TypeAlias = Literal["receive", "parse", "dispatch", "task", "listeners"]
+LabelKey: TypeAlias = "tuple[int, int]"  # (app id, emsg)
+Labels: TypeAlias = "tuple[tuple[str, str], ...]"
+
+DEFAULT_BUCKETS: Final = (
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.000_25,
+    0.000_5,
+    0.001,
+    0.002_5,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class GCInstrumentation:
+    """The hooks :meth:`GCState.parse_gc_message` calls as GC messages go through it, they all do nothing by default.
+
+    Pass an instance as the ``gc_instrumentation`` client option to use it. Without one the hooks aren't called and
+    nothing is timed. Stages are:
+
+    - ``receive`` the whole time spent handling a message.
+    - ``parse`` deserializing the message.
+    - ``dispatch`` calling its parser, for a coroutine parser this is only creating the coroutine.
+    - ``task`` how long a coroutine parser's task took to finish.
+    - ``listeners`` resolving the :meth:`GCState.gc_wait_for` listeners for the message.
+    """
+
+    __slots__ = ()
+
+    def message_received(self, app_id: int, emsg: int, size: int) -> None:
+        """Called when a message of ``size`` bytes is received."""
+
+    def message_ignored(self, app_id: int, emsg: int, *, parsed: bool) -> None:
+        """Called when nothing handles a message, ``parsed`` is whether it was deserialized before that was known."""
+
+    def task_spawned(self, app_id: int, emsg: int) -> None:
+        """Called when a coroutine parser is scheduled as a task."""
+
+    def error(self, stage: Stage, app_id: int, emsg: int) -> None:
+        """Called when deserializing a message or running its parser fails."""
+
+    def observe(self, stage: Stage, app_id: int, emsg: int, seconds: float) -> None:
+        """Called with how long ``stage`` took for a message."""
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class GCMetrics(GCInstrumentation):
+    """A :class:`GCInstrumentation` that keeps counters and latency histograms per app and EMsg.
+
+    One instance can be shared between clients, e.g. every client in a fleet, to aggregate their traffic.
+    :meth:`to_prometheus` formats the metrics in the Prometheus text exposition format, which can be served however
+    you like or written with :meth:`write_prometheus` for node_exporter's textfile collector.
+
+    Parameters
+    ----------
+    buckets
+        The upper bounds in seconds of the latency histograms' buckets.
+    prefix
+        The prefix of the metric names.
+    """
+
+    __slots__ = ("buckets", "prefix", "received", "received_bytes", "ignored", "tasks", "errors", "latencies")
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "steam_gc"):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.received: dict[LabelKey, int] = {}
+        self.received_bytes: dict[LabelKey, int] = {}
+        self.ignored: dict[tuple[int, int, bool], int] = {}
+        self.tasks: dict[LabelKey, int] = {}
+        self.errors: dict[tuple[Stage, int, int], int] = {}
+        self.latencies: dict[tuple[Stage, int, int], Histogram] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} received={sum(self.received.values())} tasks={sum(self.tasks.values())}>"
+
+    def message_received(self, app_id: int, emsg: int, size: int) -> None:
+        key = (app_id, emsg)
+        self.received[key] = self.received.get(key, 0) + 1
+        self.received_bytes[key] = self.received_bytes.get(key, 0) + size
+
+    def message_ignored(self, app_id: int, emsg: int, *, parsed: bool) -> None:
+        key = (app_id, emsg, parsed)
+        self.ignored[key] = self.ignored.get(key, 0) + 1
+
+    def task_spawned(self, app_id: int, emsg: int) -> None:
+        key = (app_id, emsg)
+        self.tasks[key] = self.tasks.get(key, 0) + 1
+
+    def error(self, stage: Stage, app_id: int, emsg: int) -> None:
+        key = (stage, app_id, emsg)
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def observe(self, stage: Stage, app_id: int, emsg: int, seconds: float) -> None:
+        try:
+            histogram = self.latencies[stage, app_id, emsg]
+        except KeyError:
+            histogram = self.latencies[stage, app_id, emsg] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def clear(self) -> None:
+        """Reset every metric."""
+        for metric in (self.received, self.received_bytes, self.ignored, self.tasks, self.errors, self.latencies):
+            metric.clear()
+
+    def to_prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        prefix = self.prefix
+        lines: list[str] = []
+
+        def counter(name: str, help: str, values: dict[Labels, int]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(f"{prefix}_{name}{_labels(labels)} {value}" for labels, value in sorted(values.items()))
+
+        counter(
+            "messages_received_total",
+            "GC messages received.",
+            {_app_emsg(*key): value for key, value in self.received.items()},
+        )
+        counter(
+            "received_bytes_total",
+            "Bytes of GC messages received.",
+            {_app_emsg(*key): value for key, value in self.received_bytes.items()},
+        )
+        counter(
+            "messages_ignored_total",
+            "GC messages that nothing handled.",
+            {
+                (*_app_emsg(app_id, emsg), ("parsed", "true" if parsed else "false")): value
+                for (app_id, emsg, parsed), value in self.ignored.items()
+            },
+        )
+        counter(
+            "parser_tasks_total",
+            "Tasks created for coroutine GC parsers.",
+            {_app_emsg(*key): value for key, value in self.tasks.items()},
+        )
+        counter(
+            "errors_total",
+            "GC messages that failed to deserialize or whose parser raised.",
+            {
+                (("stage", stage), *_app_emsg(app_id, emsg)): value
+                for (stage, app_id, emsg), value in self.errors.items()
+            },
+        )
+
+        name = f"{prefix}_stage_seconds"
+        lines.append(f"# HELP {name} Time spent in each stage of handling a GC message.")
+        lines.append(f"# TYPE {name} histogram")
+        for (stage, app_id, emsg), histogram in sorted(self.latencies.items()):
+            labels = (("stage", stage), *_app_emsg(app_id, emsg))
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_labels((*labels, ('le', le)))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | os.PathLike[str]) -> None:
+        """Atomically write :meth:`to_prometheus` to ``path``, e.g. for node_exporter's textfile collector."""
+        directory = os.path.dirname(os.fspath(path)) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".steam_gc_metrics", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(self.to_prometheus())
+            os.chmod(tmp_path, 0o644)  # mkstemp creates it 0600, so the collector might not be able to read it
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _app_emsg(app_id: int, emsg: int) -> Labels:
+    return (("app_id", str(app_id)), ("emsg", str(emsg)))
+
+
+def _labels(labels: Labels) -> str:
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}"
@@ -0,0 +1,204 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from ..app import App
+    from ..gateway import GCMsgs
+
+__all__ = (
+    "SendPriority",
+    "GCSendMetrics",
+)
+
+log = logging.getLogger(__name__)
+
+
+class SendPriority(IntEnum):
+    """The priority of a message sent to the GC, lower values are sent first."""
+
+    Critical = 0
+    """Messages that keep the session alive, like the hello and heartbeat."""
+    High = 1
+    Normal = 2
+    Low = 3
+    """Bulk requests like inspects."""
+
+
+class GCSendMetrics(NamedTuple):
+    queue_depth: dict[SendPriority, int]
+    """The number of messages waiting to be sent for each priority."""
+    sent: int
+    """The number of messages sent."""
+    total_wait: float
+    """The total time in seconds messages spent waiting to be sent."""
+    max_wait: float
+    """The longest time in seconds a message spent waiting to be sent."""
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self) -> float:
+        """How long until a token is free."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait before it can be used."""
+        self._refill()
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class _Pending(NamedTuple):
+    msg: GCMsgs
+    app: App | None
+    future: asyncio.Future[None]
+    queued_at: float
+
+
+class GCSendScheduler:
+    """Sends GC messages in priority order while keeping each message type under its rate limit.
+
+    Callers wait until their message has been written, and once ``max_pending`` messages are waiting new callers wait
+    for one of them to be sent before queueing theirs. Once :meth:`close` is called sends are rejected until
+    :meth:`reopen` is.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[GCMsgs], Awaitable[Any]],
+        set_app: Callable[[App], object],
+        *,
+        priorities: Mapping[type[GCMsgs], SendPriority],
+        rates: Mapping[type[GCMsgs], tuple[float, int]],
+        max_pending: int = 256,
+    ):
+        self._send = send
+        self._set_app = set_app
+        self.priorities = priorities
+        self.buckets = {msg: TokenBucket(rate, burst) for msg, (rate, burst) in rates.items()}
+        self._queues: dict[SendPriority, dict[type[GCMsgs], deque[_Pending]]] = {
+            priority: {} for priority in SendPriority
+        }
+        self._slots = asyncio.Semaphore(max_pending)
+        self._wake = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+        self.sent = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def metrics(self) -> GCSendMetrics:
+        return GCSendMetrics(
+            {priority: sum(len(queue) for queue in queues.values()) for priority, queues in self._queues.items()},
+            self.sent,
+            self.total_wait,
+            self.max_wait,
+        )
+
+    async def send(self, msg: GCMsgs, *, app: App | None = None, priority: SendPriority | None = None) -> None:
+        if priority is None:
+            priority = self.priorities.get(msg.__class__, SendPriority.Normal)
+
+        if self._closed:
+            raise RuntimeError("GC send scheduler is closed")
+        async with self._slots:
+            if self._closed:  # closed while waiting for a slot
+                raise RuntimeError("GC send scheduler is closed")
+            future = asyncio.get_running_loop().create_future()
+            try:
+                queue = self._queues[priority][msg.__class__]
+            except KeyError:
+                queue = self._queues[priority][msg.__class__] = deque()
+            queue.append(_Pending(msg, app, future, time.monotonic()))
+            self._wake.set()
+            if self._worker is None or self._worker.done():
+                self._worker = asyncio.create_task(self._run(), name="steam.py GC send scheduler")
+            await future
+
+    def _next(self) -> tuple[_Pending | None, float]:
+        # return the first message from the highest priority type that has a free token, or how long until one does
+        soonest = float("inf")
+        for queues in self._queues.values():
+            for msg_type, queue in queues.items():
+                while queue and queue[0].future.done():
+                    queue.popleft()  # the caller was cancelled
+                if not queue:
+                    continue
+                bucket = self.buckets.get(msg_type)
+                if bucket is not None:
+                    if delay := bucket.delay():
+                        soonest = min(soonest, delay)
+                        continue
+                    bucket.reserve()
+                queues[msg_type] = queues.pop(msg_type)  # round robin between the types of the same priority
+                return queue.popleft(), 0.0
+        return None, soonest
+
+    async def _run(self) -> None:
+        while True:
+            pending, delay = self._next()
+            if pending is None:
+                self._wake.clear()
+                try:
+                    if delay == float("inf"):
+                        await self._wake.wait()
+                    else:
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            wait = time.monotonic() - pending.queued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if pending.app is not None:
+                self._set_app(pending.app)
+            try:
+                await self._send(pending.msg)
+            except asyncio.CancelledError:
+                pending.future.cancel()
+                raise
+            except Exception as exc:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            else:
+                self.sent += 1
+                if not pending.future.done():
+                    pending.future.set_result(None)
+
+    def close(self) -> None:
+        """Stop sending messages, cancelling any that are waiting to be sent and rejecting any new ones."""
+        self._closed = True
+        if self._worker is not None:
+            self._worker.cancel()
+        for queues in self._queues.values():
+            for queue in queues.values():
+                for pending in queue:
+                    pending.future.cancel()
+                queue.clear()
+
+    def reopen(self) -> None:
+        """Start accepting messages again after :meth:`close`."""
+        self._closed = False
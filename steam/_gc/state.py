@@ -5,16 +5,19 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from contextvars import ContextVar
+from functools import partial
+from time import perf_counter
 from types import CoroutineType
-from typing import TYPE_CHECKING, Any, Final, TypeVar, get_args
+from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar, get_args
 
 from typing_extensions import Self
 
 from steam.protobufs import friends
 from steam.user import User
 
+from .. import _const
 from .._const import CLEAR_PROTO_BIT, IS_PROTO
 from ..app import App
 from ..gateway import GCMsgs
@@ -23,6 +26,8 @@ from ..protobufs.emsg import EMsg
 from ..state import ConnectionState, ParserCallback
 from ..trade import Inventory, Item
 from ..types.id import AppID, AssetID
+from .metrics import GCInstrumentation
+from .scheduler import GCSendMetrics, GCSendScheduler, SendPriority
 
 if TYPE_CHECKING:
     from ..protobufs.client_server_2 import CMsgGcClientFromGC
@@ -30,6 +35,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 Inv = TypeVar("Inv", bound=Inventory)
+GCMsgT = TypeVar("GCMsgT", bound=GCMsgs)
+GCListenerKey = tuple[AppID, int]
 
 APP = ContextVar[App]("APP")
 
@@ -56,18 +63,60 @@ class MultiEvent:
         self.ready.clear()
 
 
+class LazyGCMessage:
+    """A GC message that nothing is waiting for, it's only deserialized if it's formatted, e.g. in a debug log."""
+
+    __slots__ = ("app_id", "msgtype", "payload")
+
+    def __init__(self, app_id: AppID, msgtype: int, payload: bytes):
+        self.app_id = app_id
+        self.msgtype = msgtype
+        self.payload = payload
+
+    def parse(self) -> GCMsgs:
+        return (GCProtobufMessage if IS_PROTO(self.msgtype) else GCMessage)().parse(
+            memoryview(self.payload)[4:], CLEAR_PROTO_BIT(self.msgtype), self.app_id
+        )
+
+    def __repr__(self) -> str:
+        try:
+            return repr(self.parse())
+        except Exception:
+            return f"<{self.__class__.__name__} app_id={self.app_id} emsg={CLEAR_PROTO_BIT(self.msgtype)}>"
+
+
 class GCState(ConnectionState):
     gc_parsers: dict[
         type[GCMsgs], ParserCallback[Self, GCMsgs]
     ]  # different to parsers to save on dict lookups 1 vs 2 (1 for app, 1 for msg)
+    gc_parser_emsgs: frozenset[int] | None  # None if a parser's message doesn't have an EMsg so we can't skip parsing
     client: Client
     _APP: Final[App]  # type: ignore
+    _GC_SEND_PRIORITIES: ClassVar[Mapping[type[GCMsgs], SendPriority]] = {}
+    _GC_SEND_RATES: ClassVar[Mapping[type[GCMsgs], tuple[float, int]]] = {}  # (messages per second, burst)
 
     def __init__(self, client: Client, **kwargs: Any):
         self._gc_connected = MultiEvent(len(client._GC_APPS))
         self._gc_ready = MultiEvent(len(client._GC_APPS))
         self.backpacks: Mapping[AppID, Inventory[Item[ClientUser], ClientUser]] = None  # type: ignore
         self.items_waiting: dict[tuple[AppID, AssetID], asyncio.Future[Item[ClientUser]]] = {}
+        self.gc_listeners: dict[GCListenerKey, dict[asyncio.Future[Any], Callable[[Any], bool] | None]] = {}
+        self.gc_request_timeout: float = kwargs.pop("gc_request_timeout", 30.0)
+        self.gc_request_retries: int = kwargs.pop("gc_request_retries", 2)
+        self.gc_heartbeat: bool = kwargs.pop("gc_heartbeat", True)
+        self.gc_instrumentation: GCInstrumentation | None = kwargs.pop("gc_instrumentation", None)
+        priorities: dict[type[GCMsgs], SendPriority] = {}
+        rates: dict[type[GCMsgs], tuple[float, int]] = {}
+        for cls in reversed(self.__class__.__mro__):  # the composed state has a base per GC app
+            priorities |= cls.__dict__.get("_GC_SEND_PRIORITIES", {})
+            rates |= cls.__dict__.get("_GC_SEND_RATES", {})
+        self.gc_sender = GCSendScheduler(
+            lambda msg: self.ws.send_gc_message(msg),
+            APP.set,
+            priorities=priorities,
+            rates=rates | kwargs.pop("gc_send_rates", {}),
+            max_pending=kwargs.pop("gc_max_pending_sends", 256),
+        )
 
         app = kwargs.pop("app", None)
         if app is not None:  # don't let them overwrite the main app
@@ -80,6 +129,10 @@ class GCState(ConnectionState):
         super().__init__(client, **kwargs)
         self._original_client_user_msg: friends.CMsgClientPersonaStateFriend | None = None
 
+    def clear(self) -> None:
+        super().clear()
+        self.gc_sender.reopen()  # the client is being reused after being closed
+
     def __init_subclass__(cls) -> None:
         cls.gc_parsers = {}
         for _, func in inspect.getmembers(cls, lambda x: inspect.isfunction and hasattr(x, "__parser__")):
@@ -88,6 +141,10 @@ class GCState(ConnectionState):
                 args[0] if (args := get_args(params[0])) else params[0]
             )  # if it's a union only use the first type (Message | None or Message | Any)
             cls.gc_parsers[msg] = func
+        try:
+            cls.gc_parser_emsgs = frozenset(msg.MSG for msg in cls.gc_parsers)
+        except AttributeError:
+            cls.gc_parser_emsgs = None
 
     def _get_gc_message(self) -> GCProtobufMessage | GCMessage:
         raise NotImplementedError()
@@ -95,13 +152,40 @@ class GCState(ConnectionState):
     async def parse_gc_message(self, msg: CMsgGcClientFromGC) -> None:
         app_id = AppID(msg.appid)
         emsg_value = CLEAR_PROTO_BIT(msg.msgtype)
+        if (instrumentation := self.gc_instrumentation) is None:
+            return self._parse_gc_message(msg, app_id, emsg_value, None)
 
+        instrumentation.message_received(app_id, emsg_value, len(msg.payload))
+        started_at = perf_counter()
+        try:
+            self._parse_gc_message(msg, app_id, emsg_value, instrumentation)
+        finally:
+            instrumentation.observe("receive", app_id, emsg_value, perf_counter() - started_at)
+
+    def _parse_gc_message(
+        self, msg: CMsgGcClientFromGC, app_id: AppID, emsg_value: int, instrumentation: GCInstrumentation | None
+    ) -> None:
+        # the instrumentation is None unless it's been enabled, so it costs nothing but these checks otherwise
+        if (
+            self.gc_parser_emsgs is not None
+            and emsg_value not in self.gc_parser_emsgs
+            and (app_id, emsg_value) not in self.gc_listeners
+        ):  # nothing is going to look at it so don't deserialize it
+            if instrumentation is not None:
+                instrumentation.message_ignored(app_id, emsg_value, parsed=False)
+            return log.debug("Ignoring event %r", LazyGCMessage(app_id, msg.msgtype, msg.payload))
+
+        started_at = perf_counter() if instrumentation is not None else 0.0
         try:
             gc_msg = (GCProtobufMessage if IS_PROTO(msg.msgtype) else GCMessage)().parse(
                 msg.payload[4:], emsg_value, app_id
             )
         except Exception as exc:
+            if instrumentation is not None:
+                instrumentation.error("parse", app_id, emsg_value)
             return log.error("Failed to deserialize message: %r, %r", emsg_value, msg.payload, exc_info=exc)
+        if instrumentation is not None:
+            instrumentation.observe("parse", app_id, emsg_value, perf_counter() - started_at)
 
         log.debug("Socket has received GC message %r from the websocket.", gc_msg)
         APP.set(self.client._GC_APPS[app_id])
@@ -109,44 +193,139 @@ class GCState(ConnectionState):
         try:
             event_parser = self.gc_parsers[gc_msg.__class__]
         except (KeyError, TypeError):
+            if instrumentation is not None:
+                instrumentation.message_ignored(app_id, emsg_value, parsed=True)
             try:
                 log.debug("Ignoring event %r", gc_msg, exc_info=True)
             except Exception:
                 log.debug("Ignoring event with %r", gc_msg.__class__)
         else:
+            if instrumentation is not None:
+                started_at = perf_counter()
             try:
                 result = event_parser(self, gc_msg)
             except Exception:
+                if instrumentation is not None:
+                    instrumentation.error("dispatch", app_id, emsg_value)
                 return log.exception("Failed to execute %r", event_parser.__name__)
+            if instrumentation is not None:
+                instrumentation.observe("dispatch", app_id, emsg_value, perf_counter() - started_at)
 
             if isinstance(result, CoroutineType):
-                self._tg.create_task(result, name=f"steam.py GC {app_id}: {event_parser.__name__}").add_done_callback(
-                    self._run_parser_callback
-                )
-
-        # remove the dispatched listener
-        removed: list[int] = []
-        for idx, entry in enumerate(self.ws.gc_listeners):
-            if entry.msg != emsg_value or entry.app_id != app_id:
-                continue
-
-            future = entry.future
-            if future.cancelled():
-                removed.append(idx)
-                continue
-
+                task = self._tg.create_task(result, name=f"steam.py GC {app_id}: {event_parser.__name__}")
+                task.add_done_callback(self._run_parser_callback)
+                if instrumentation is not None:
+                    instrumentation.task_spawned(app_id, emsg_value)
+                    task.add_done_callback(
+                        partial(self._observe_gc_task, instrumentation, app_id, emsg_value, perf_counter())
+                    )
+
+        # resolve the listeners waiting for this message
+        if listeners := self.gc_listeners.get((app_id, emsg_value)):
+            if instrumentation is not None:
+                started_at = perf_counter()
+            for future, check in tuple(listeners.items()):
+                if future.done():
+                    continue  # its done callback will remove it
+
+                try:
+                    valid = check is None or check(gc_msg)
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    if valid:
+                        future.set_result(gc_msg)
+            if instrumentation is not None:
+                instrumentation.observe("listeners", app_id, emsg_value, perf_counter() - started_at)
+
+    @staticmethod
+    def _observe_gc_task(
+        instrumentation: GCInstrumentation, app_id: AppID, emsg_value: int, started_at: float, task: asyncio.Task[Any]
+    ) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            instrumentation.error("task", app_id, emsg_value)
+        instrumentation.observe("task", app_id, emsg_value, perf_counter() - started_at)
+
+    def gc_wait_for(
+        self,
+        msg: type[GCMsgT],
+        *,
+        app_id: int | None = None,
+        check: Callable[[GCMsgT], bool] | None = None,
+    ) -> asyncio.Future[GCMsgT]:
+        """Wait for a GC message of type ``msg`` from ``app_id`` that passes ``check``.
+
+        Listeners are stored by ``(app_id, emsg)`` so dispatching a message only looks at the listeners for it, the
+        listener is removed as soon as its future is done or cancelled.
+        """
+        future: asyncio.Future[GCMsgT] = asyncio.get_running_loop().create_future()
+        key = (AppID(app_id if app_id is not None else APP.get(self.client._APP).id), msg.MSG)
+        try:
+            listeners = self.gc_listeners[key]
+        except KeyError:
+            listeners = self.gc_listeners[key] = {}
+        listeners[future] = check
+        future.add_done_callback(partial(self._remove_gc_listener, key))
+        return future
+
+    async def send_gc_message(self, msg: GCMsgs, *, priority: SendPriority | None = None) -> None:
+        """Queue ``msg`` to be sent to the GC, waiting until it has been sent.
+
+        Messages are sent in order of ``priority``, defaulting to the priority in ``_GC_SEND_PRIORITIES`` for the
+        message's type, and each message type is kept under its rate in ``_GC_SEND_RATES``.
+        """
+        await self.gc_sender.send(msg, app=APP.get(None), priority=priority)
+
+    def gc_send_metrics(self) -> GCSendMetrics:
+        """The queue depth and wait time metrics of the GC send queue."""
+        return self.gc_sender.metrics()
+
+    async def gc_request(
+        self,
+        msg: GCMsgs,
+        response: type[GCMsgT],
+        *,
+        app_id: int | None = None,
+        check: Callable[[GCMsgT], bool] | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+    ) -> GCMsgT:
+        """Send ``msg`` to the GC and wait for its ``response``.
+
+        If the GC doesn't respond within ``timeout`` seconds ``msg`` is sent again up to ``retries`` times, these
+        default to :attr:`gc_request_timeout` and :attr:`gc_request_retries`. Requests that change something should
+        pass ``retries=0``. The listener for the response is always removed, even if this is cancelled.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            The GC didn't respond to any of the attempts.
+        """
+        timeout = self.gc_request_timeout if timeout is None else timeout
+        retries = self.gc_request_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            future = self.gc_wait_for(response, app_id=app_id, check=check)
             try:
-                valid = entry.check(gc_msg)
-            except Exception as exc:
-                future.set_exception(exc)
-                removed.append(idx)
-            else:
-                if valid:
-                    future.set_result(gc_msg)
-                    removed.append(idx)
-
-        for idx in reversed(removed):
-            del self.ws.gc_listeners[idx]
+                await self.send_gc_message(msg)
+                async with _const.timeout(timeout):
+                    return await future
+            except asyncio.TimeoutError:
+                if attempt == retries:
+                    raise
+                log.debug("GC didn't respond to %r, retrying (%d/%d)", msg, attempt + 1, retries)
+            finally:
+                future.cancel()  # removes the listener if it's still waiting
+
+        raise AssertionError("unreachable")
+
+    def _remove_gc_listener(self, key: GCListenerKey, future: asyncio.Future[Any]) -> None:
+        try:
+            listeners = self.gc_listeners[key]
+            del listeners[future]
+        except KeyError:
+            return
+        if not listeners:
+            del self.gc_listeners[key]
 
     async def fetch_backpack(self, backpack_cls: type[Inv]) -> Inv:
         app = APP.get()
@@ -166,10 +345,13 @@ class GCState(ConnectionState):
             future.set_result(item)
 
     async def wait_for_item(self, id: AssetID) -> Item[ClientUser]:  # No intersection :( Item[ClientUser] & Any
-        self.items_waiting[
-            (APP.get().id, id)
-        ] = future = asyncio.get_running_loop().create_future()  # TODO does this need to use ContextID as well?
-        return await future
+        key = (APP.get().id, id)  # TODO does this need to use ContextID as well?
+        self.items_waiting[key] = future = asyncio.get_running_loop().create_future()
+        try:
+            return await future
+        finally:
+            if self.items_waiting.get(key) is future:
+                del self.items_waiting[key]
 
 
 GCState.parsers = ConnectionState.parsers | {EMsg.ClientFromGC: GCState.parse_gc_message}  # type: ignore
@@ -7,6 +7,13 @@ A library for interacting with the CSGO Game Coordinator.
 Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE
 """
 
+from ..._gc.metrics import *
 from .backpack import *
+from .cache import *
 from .client import *
+from .decoders import *
+from .fleet import *
+from .inspect_cache import *
+from .inspect_pool import *
+from .inspect_store import *
 from .models import *
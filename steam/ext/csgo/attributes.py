@@ -0,0 +1,207 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import math
+import struct
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, TypeVar
+
+import betterproto
+
+from ... import utils
+from ..._const import READ_U32
+from ...types.id import AssetID
+from .backpack import Paint, Sticker
+from .enums import ItemFlags, ItemOrigin, ItemQuality
+from .protobufs import base
+
+if TYPE_CHECKING:
+    from .backpack import BaseItem
+
+MessageT = TypeVar("MessageT", bound=betterproto.Message)
+
+
+def READ_F32(bytes: bytes, *, _unpacker: Callable[[bytes], tuple[float]] = struct.Struct("<f").unpack_from) -> float:
+    (f32,) = _unpacker(bytes)
+    return f32
+
+
+def READ_STRING(bytes: bytes | memoryview) -> str:
+    return str(bytes[2:], "utf-8")  # first 2 bytes are the length
+
+
+@dataclass(slots=True)
+class DecodedAttributes:
+    """The attributes of a :class:`base.Item` that we care about, decoded in a single pass."""
+
+    custom_name: str | None = None
+    paint_index: float | None = None
+    paint_seed: float | None = None
+    paint_wear: float | None = None
+    tradable_after: int | None = None
+    contained_item_count: int | None = None
+    casket_id_low: int | None = None
+    casket_id_high: int | None = None
+    sticker_ids: dict[int, int] = field(default_factory=dict)
+    sticker_attributes: dict[int, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def casket_id(self) -> AssetID | None:
+        if self.casket_id_low is None or self.casket_id_high is None:
+            return None
+        return AssetID(self.casket_id_high << 32 | self.casket_id_low)
+
+    @property
+    def paint(self) -> Paint | None:
+        if self.paint_index is None and self.paint_seed is None and self.paint_wear is None:
+            return None
+        return Paint(
+            index=self.paint_index or 0,
+            seed=math.floor(self.paint_seed) if self.paint_seed is not None else 0,
+            wear=self.paint_wear or 0,
+        )
+
+    @property
+    def stickers(self) -> list[Sticker]:
+        return [
+            Sticker(slot=slot, id=id, **self.sticker_attributes.get(slot, {}))  # type: ignore
+            for slot, id in sorted(self.sticker_ids.items())
+        ]
+
+
+AttributeDecoder = Callable[[DecodedAttributes, bytes], None]
+
+
+def _field(name: str, read: Callable[[bytes], object]) -> AttributeDecoder:
+    def decoder(attributes: DecodedAttributes, value_bytes: bytes) -> None:
+        setattr(attributes, name, read(value_bytes))
+
+    return decoder
+
+
+def _sticker_id(slot: int) -> AttributeDecoder:
+    def decoder(attributes: DecodedAttributes, value_bytes: bytes) -> None:
+        attributes.sticker_ids[slot] = READ_U32(value_bytes)
+
+    return decoder
+
+
+def _sticker_field(slot: int, name: str) -> AttributeDecoder:
+    def decoder(attributes: DecodedAttributes, value_bytes: bytes) -> None:
+        try:
+            sticker_attributes = attributes.sticker_attributes[slot]
+        except KeyError:
+            sticker_attributes = attributes.sticker_attributes[slot] = {}
+        sticker_attributes[name] = READ_F32(value_bytes)
+
+    return decoder
+
+
+ATTRIBUTE_DECODERS: Final[dict[int, AttributeDecoder]] = {
+    6: _field("paint_index", READ_F32),
+    7: _field("paint_seed", READ_F32),
+    8: _field("paint_wear", READ_F32),
+    75: _field("tradable_after", READ_U32),
+    111: _field("custom_name", READ_STRING),
+    270: _field("contained_item_count", READ_U32),
+    272: _field("casket_id_low", READ_U32),
+    273: _field("casket_id_high", READ_U32),
+}
+for slot in range(4, 24, 4):  # sticker slots have their ID at 113 + slot followed by their decodeable attributes
+    ATTRIBUTE_DECODERS[113 + slot] = _sticker_id(slot)
+    for idx, attr in enumerate(Sticker._decodeable_attrs):
+        ATTRIBUTE_DECODERS[114 + slot + idx] = _sticker_field(slot, attr)
+del slot, idx, attr
+
+
+def decode_attributes(attributes: Iterable[base.ItemAttribute]) -> DecodedAttributes:
+    """Decode ``attributes`` walking over them once."""
+    decoded = DecodedAttributes()
+    for attribute in attributes:
+        try:
+            decoder = ATTRIBUTE_DECODERS[attribute.def_index]
+        except KeyError:
+            continue
+        decoder(decoded, attribute.value_bytes)
+    return decoded
+
+
+class DecodedItem(NamedTuple):
+    """A :class:`base.Item` and its decoded attributes, ready to be merged in to the backpack."""
+
+    item: base.Item
+    attributes: DecodedAttributes
+    data: bytes | None = None  # what the item was parsed from, so it can be stored without serialising it again
+
+
+def decode_item(data: bytes) -> DecodedItem:
+    """Parse the item in ``data`` and decode its attributes."""
+    item = base.Item().parse(data)
+    return DecodedItem(item, decode_attributes(item.attribute), bytes(data))
+
+
+def decode_items(object_data: Iterable[bytes]) -> list[DecodedItem]:
+    """Parse every item in ``object_data`` and decode its attributes, this can be run in a thread or process pool."""
+    return [decode_item(data) for data in object_data]
+
+
+_EMPTY_MESSAGES: dict[type[betterproto.Message], dict[str, Any]] = {}
+
+
+def _empty_message(cls: type[MessageT]) -> MessageT:
+    # the same as cls() without going through the dataclass __init__ and betterproto's __post_init__
+    try:
+        template = _EMPTY_MESSAGES[cls]
+    except KeyError:
+        template = _EMPTY_MESSAGES[cls] = cls().__dict__
+    message = object.__new__(cls)
+    message.__dict__.update(template, _group_current={})
+    return message
+
+
+@cache
+def _field_defaults(cls: type[betterproto.Message]) -> tuple[tuple[str, Callable[[], Any]], ...]:
+    return tuple(
+        (
+            name,
+            partial(_empty_message, default)
+            if isinstance(default, type) and issubclass(default, betterproto.Message)
+            else default,
+        )
+        for name, default in cls()._betterproto.default_gen.items()
+    )
+
+
+def copy_fields(target: BaseItem, gc_item: base.Item) -> None:
+    """Set every field of ``gc_item`` on ``target``."""
+    # reading __dict__ skips betterproto's __getattribute__, which is slow and resolves an unset field's default
+    # through warnings.catch_warnings every time
+    values = gc_item.__dict__
+    for name, default in _field_defaults(base.Item):
+        value = values[name]
+        setattr(target, name, default() if value is betterproto.PLACEHOLDER else value)
+
+
+def merge_attributes(
+    target: BaseItem, gc_item: base.Item, attributes: DecodedAttributes, *, is_new: bool = False
+) -> None:
+    """Set the attributes decoded from ``gc_item`` on ``target``."""
+    target.position = 0 if is_new else gc_item.inventory & 0xFFFF
+
+    if attributes.custom_name is not None:
+        target.custom_name = attributes.custom_name
+
+    if (paint := attributes.paint) is not None:
+        target.paint = paint
+
+    if attributes.tradable_after is not None:
+        target.tradable_after = utils.DateTime.from_timestamp(attributes.tradable_after)
+
+    target.stickers = attributes.stickers
+
+    target.quality = ItemQuality.try_value(gc_item.quality)
+    target.flags = ItemFlags.try_value(gc_item.flags)
+    target.origin = ItemOrigin.try_value(gc_item.origin)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABCMeta
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, cast
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, cast
 from typing_extensions import Literal, Self, TypeVar
 
 from ... import utils
+from ..._const import timeout
 from ...abc import BaseUser, PartialUser
 from ...trade import Inventory, Item
 from ...types.id import AssetID
@@ -24,6 +25,7 @@ from .enums import (
 from .protobufs import base, econ, struct_messages
 
 if TYPE_CHECKING:
+    from ...types.trade import InventoryDict
     from .client import ClientUser
     from .state import GCState
 
@@ -147,7 +149,7 @@ class CasketItem(BaseItem):
     @property
     def casket(self) -> Casket:
         """The casket this item is from."""
-        casket = utils.get(self._state.backpack, id=self._casket_id)
+        casket = self._state.backpack.get_item(self._casket_id)
         assert isinstance(casket, Casket)
         return casket
 
@@ -234,6 +236,7 @@ else:
 
 
 F = TypeVar("F", bound=Callable[..., object])
+ItemT = TypeVar("ItemT", bound="BackpackItem[ClientUser] | CasketItem")
 
 
 def has_to_be_in_our_inventory(func: F) -> F:
@@ -270,23 +273,17 @@ class BackpackItem(BaseBackpackItem[OwnerT]):
         tag
             The tag to consume for this request.
         """
-        future = self._state.gc_wait_for(
+        await self._state.gc_request(
+            struct_messages.NameItemRequest(name_tag_id=tag.id, item_id=self.id, name=name),
             econ.ItemCustomizationNotification,
-            check=lambda msg: (
-                isinstance(msg, econ.ItemCustomizationNotification)
-                and msg.request == ItemCustomizationNotificationEnum.NameItem
-                and msg.item_id[0] == self.id
-            ),
-        )
-        await self._state.ws.send_gc_message(
-            struct_messages.NameItemRequest(name_tag_id=tag.id, item_id=self.id, name=name)
+            check=lambda msg: msg.request == ItemCustomizationNotificationEnum.NameItem and msg.item_id[0] == self.id,
+            retries=0,
         )
-        await future
 
     @has_to_be_in_our_inventory
     async def delete(self: BackpackItem[ClientUser]) -> None:
         """Delete this item."""
-        await self._state.ws.send_gc_message(struct_messages.DeleteItemRequest(item_id=self.id))
+        await self._state.send_gc_message(struct_messages.DeleteItemRequest(item_id=self.id))
 
     @property
     def inspect_url(self) -> str | None:
@@ -333,14 +330,14 @@ class Casket(BackpackItem["ClientUser"]):
         item
             The item to add.
         """
-        future = self._state.gc_wait_for(
+        await self._state.gc_request(
+            econ.CasketItemAdd(casket_item_id=self.id, item_item_id=item.id),
             econ.ItemCustomizationNotification,
             check=lambda msg: (
                 msg.request == ItemCustomizationNotificationEnum.CasketAdded and msg.item_id[0] == self.id
             ),
+            retries=0,
         )
-        await self._state.ws.send_gc_message(econ.CasketItemAdd(casket_item_id=self.id, item_item_id=item.id))
-        await future
         self.contained_item_count += 1
 
     async def remove(self, item: CasketItem) -> BackpackItem[ClientUser]:
@@ -358,36 +355,170 @@ class Casket(BackpackItem["ClientUser"]):
         if item._casket_id != self.id:
             raise ValueError("item is not in this casket")
 
-        future = self._state.gc_wait_for(
-            econ.ItemCustomizationNotification,
-            check=lambda msg: (
-                msg.request == ItemCustomizationNotificationEnum.CasketRemoved and msg.item_id[0] == self.id
-            ),
-        )
-        await self._state.ws.send_gc_message(econ.CasketItemExtract(casket_item_id=self.id, item_item_id=item.id))
-        await future
-        self.contained_item_count -= 1
+        key = (self.app.id, item.id)  # register this before the request is sent so the item can't be missed
+        received = self._state.items_waiting[key] = asyncio.get_running_loop().create_future()
+        try:
+            await self._state.gc_request(
+                econ.CasketItemExtract(casket_item_id=self.id, item_item_id=item.id),
+                econ.ItemCustomizationNotification,
+                check=lambda msg: (
+                    msg.request == ItemCustomizationNotificationEnum.CasketRemoved and msg.item_id[0] == self.id
+                ),
+                retries=0,
+            )
+            self.contained_item_count -= 1
+
+            async with timeout(self._state.gc_request_timeout):
+                return cast("BackpackItem[ClientUser]", await received)
+        finally:
+            if self._state.items_waiting.get(key) is received:
+                del self._state.items_waiting[key]
+
+    async def add_many(
+        self, items: Iterable[BackpackItem[ClientUser]], *, window: int = 10
+    ) -> AsyncGenerator[BackpackItem[ClientUser], None]:
+        """Add many items to this casket, keeping up to ``window`` requests to the GC in flight at once.
+
+        Yields each item once it has been added.
 
-        return cast("BackpackItem[ClientUser]", await self._state.wait_for_item(item.id))
+        Parameters
+        ----------
+        items
+            The items to add.
+        window
+            The maximum number of requests to have in flight.
+
+        Raises
+        ------
+        ValueError
+            The casket became full, any items that were yielded before this were added.
+        """
+        async for item in self._transfer_many(
+            items,
+            econ.CasketItemAdd,
+            ItemCustomizationNotificationEnum.CasketAdded,
+            ItemCustomizationNotificationEnum.CasketTooFull,
+            window,
+        ):
+            self.contained_item_count += 1
+            yield item
+
+    async def remove_many(
+        self, items: Iterable[CasketItem], *, window: int = 10
+    ) -> AsyncGenerator[BackpackItem[ClientUser], None]:
+        """Remove many items from this casket, keeping up to ``window`` requests to the GC in flight at once.
+
+        Yields each item as a :class:`BackpackItem` in your inventory once it has been removed.
+
+        Parameters
+        ----------
+        items
+            The items to remove.
+        window
+            The maximum number of requests to have in flight.
+
+        Raises
+        ------
+        ValueError
+            Your inventory became full, any items that were yielded before this were removed.
+        """
+        items = list(items)
+        if any(item._casket_id != self.id for item in items):
+            raise ValueError("item is not in this casket")
+
+        loop = asyncio.get_running_loop()
+        received = {  # register these before any requests are sent so we can't miss an item being received
+            item.id: self._state.items_waiting.setdefault((self.app.id, item.id), loop.create_future())
+            for item in items
+        }
+        try:
+            async for item in self._transfer_many(
+                items,
+                econ.CasketItemExtract,
+                ItemCustomizationNotificationEnum.CasketRemoved,
+                ItemCustomizationNotificationEnum.CasketInvFull,
+                window,
+            ):
+                self.contained_item_count -= 1
+                async with timeout(self._state.gc_request_timeout):
+                    received_item = await received[item.id]
+                yield cast("BackpackItem[ClientUser]", received_item)
+        finally:
+            for item_id, future in received.items():
+                if not future.done():
+                    future.cancel()
+                    self._state.items_waiting.pop((self.app.id, item_id), None)
+
+    async def _transfer_many(
+        self,
+        items: Iterable[ItemT],
+        message: type[econ.CasketItemAdd | econ.CasketItemExtract],
+        success: ItemCustomizationNotificationEnum,
+        failure: ItemCustomizationNotificationEnum,
+        window: int,
+    ) -> AsyncGenerator[ItemT, None]:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if self.id in self._state.casket_notifications:
+            raise RuntimeError("Items are already being transferred to or from this casket")
+
+        # notifications are sent here by the casket's ID or an in flight item's ID, see
+        # GCState.handle_item_customization_notification, and are matched to their request by the item's ID
+        casket_notifications = self._state.casket_notifications
+        notifications = casket_notifications[self.id] = asyncio.Queue()
+        items = iter(items)
+        in_flight: dict[AssetID, ItemT] = {}
+        failed = False
+        try:
+            while True:
+                while not failed and len(in_flight) < window and (item := next(items, None)) is not None:
+                    in_flight[item.id] = item
+                    casket_notifications[item.id] = notifications
+                    await self._state.send_gc_message(message(casket_item_id=self.id, item_item_id=item.id))
+                if not in_flight:
+                    break
+
+                async with timeout(self._state.gc_request_timeout):
+                    notification = await notifications.get()
+                if notification.request not in (success, failure):
+                    continue
+                item_ids = [AssetID(item_id) for item_id in notification.item_id if item_id != self.id]
+                if not item_ids:  # it doesn't say which item it's for, the GC handles a casket's requests in order
+                    item_id = next(iter(in_flight))
+                elif (item_id := next((item_id for item_id in item_ids if item_id in in_flight), None)) is None:
+                    continue  # it's for a request that isn't ours
+                item = in_flight.pop(item_id)
+                del casket_notifications[item_id]
+                if notification.request == failure:
+                    failed = True  # stop sending, the requests still in flight will fail too
+                    continue
+                yield item
+        finally:
+            del casket_notifications[self.id]
+            for item_id in in_flight:
+                del casket_notifications[item_id]
+
+        if failed:
+            raise ValueError(
+                "Casket is full" if failure == ItemCustomizationNotificationEnum.CasketTooFull else "Inventory is full"
+            )
 
     async def contents(self) -> list[CasketItem]:
         """This casket's contents"""
         if not self.contained_item_count:
             return []
 
-        contained_items = [item for item in self._state.casket_items.values() if item._casket_id == self.id]
-        if len(contained_items) == self.contained_item_count:
-            return contained_items
+        casket_items = self._state.casket_items
+        if casket_items.count_in_casket(self.id) == self.contained_item_count:
+            return casket_items.in_casket(self.id)
 
-        future = self._state.gc_wait_for(
+        notification = await self._state.gc_request(
+            econ.CasketItemLoadContents(casket_item_id=self.id, item_item_id=self.id),
             econ.ItemCustomizationNotification,
             check=lambda msg: (
                 msg.request == ItemCustomizationNotificationEnum.CasketContents and msg.item_id[0] == self.id
             ),
         )
-        await self._state.ws.send_gc_message(econ.CasketItemLoadContents(casket_item_id=self.id, item_item_id=self.id))
-
-        notification = await future
         return await asyncio.gather(*map(self._state.wait_for_casket_item, notification.item_id[1:]))
 
     async def rename_to(self, name: str) -> None:  # type: ignore
@@ -418,7 +549,103 @@ class _FakeNameTag(BackpackItem["ClientUser"]):
 class Backpack(Inventory[BackpackItem["ClientUser"], "ClientUser"]):
     """A class to represent the client's backpack."""
 
+    __slots__ = ("_indices", "_data")
+    _indices: dict[AssetID, int]  # each item's position in items
+    _data: InventoryDict
+
+    def _update(self, data: InventoryDict) -> None:
+        if (descriptions := self._state.description_cache) is not None and "descriptions" in data:
+            # descriptions are the same for every item with the same class and instance ID so clients can share them,
+            # each item gets a copy though as its asset is merged into it
+            data["descriptions"] = [
+                descriptions.setdefault(
+                    (self._language, description["classid"], description["instanceid"]), description
+                ).copy()
+                for description in data["descriptions"]
+            ]
+        super()._update(data)
+        self._data = data  # kept for snapshots
+        self._indices = {item.id: idx for idx, item in enumerate(self.items)}
+
+    def get_item(self, id: int) -> BackpackItem[ClientUser] | None:
+        """Get an item from this backpack by its asset ID.
+
+        Unlike :func:`steam.utils.get` this doesn't need to search the backpack.
+
+        Parameters
+        ----------
+        id
+            The asset ID of the item.
+        """
+        try:
+            return self.items[self._indices[AssetID(id)]]
+        except KeyError:
+            return None
+
+    def _add_item(self, item: BackpackItem[ClientUser]) -> None:
+        try:
+            idx = self._indices[item.id]
+        except KeyError:
+            self._indices[item.id] = len(self.items)
+            self.items.append(item)  # type: ignore  # typed as a Sequence not a list
+        else:
+            self.items[idx] = item  # type: ignore
+
+    def _replace_item(self, old_item: BackpackItem[ClientUser], new_item: BackpackItem[ClientUser]) -> None:
+        idx = self._indices.pop(old_item.id)
+        self.items[idx] = new_item  # type: ignore
+        self._indices[new_item.id] = idx
+
+    def _remove_item(self, item: BackpackItem[ClientUser]) -> None:
+        # move the last item into the removed item's place rather than shifting every item after it down
+        idx = self._indices.pop(item.id)
+        last = self.items.pop()  # type: ignore
+        if idx < len(self.items):
+            self.items[idx] = last  # type: ignore
+            self._indices[last.id] = idx
+
     @property
     def caskets(self) -> Sequence[Casket]:
         """The caskets in this backpack."""
         return [item for item in self if isinstance(item, Casket)]
+
+    async def casket_contents(self, *, concurrency: int = 4) -> AsyncGenerator[tuple[Casket, list[CasketItem]], None]:
+        """Load the contents of every casket in this backpack, loading up to ``concurrency`` caskets at once.
+
+        Yields each casket and its contents as soon as they have been loaded.
+
+        Parameters
+        ----------
+        concurrency
+            The maximum number of caskets to load at once.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(casket: Casket) -> tuple[Casket, list[CasketItem]]:
+            async with semaphore:
+                return casket, await casket.contents()
+
+        tasks = [asyncio.create_task(load(casket)) for casket in self.caskets]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def load_all_casket_contents(self, *, concurrency: int = 4) -> dict[AssetID, list[CasketItem]]:
+        """Load the contents of every casket in this backpack, see :meth:`casket_contents` to get progress as each
+        casket is loaded.
+
+        Parameters
+        ----------
+        concurrency
+            The maximum number of caskets to load at once.
+
+        Returns
+        -------
+        A mapping of each casket's ID to its contents.
+        """
+        return {casket.id: contents async for casket, contents in self.casket_contents(concurrency=concurrency)}
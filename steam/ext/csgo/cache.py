@@ -0,0 +1,157 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from .protobufs import cstrike
+
+__all__ = (
+    "CacheInfo",
+    "ProfileCache",
+)
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    """The number of lookups answered without asking the GC."""
+    misses: int
+    """The number of lookups that had to ask the GC."""
+    size: int
+    """The number of entries currently cached."""
+    max_size: int
+    """The maximum number of entries that can be cached."""
+
+
+class _InFlight(Generic[VT]):
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future[VT]):
+        self.future = future
+        self.waiters = 0
+
+
+class TTLCache(Generic[KT, VT]):
+    """A bounded LRU cache of expiring entries that makes sure only one fetch for a key is in flight at a time.
+
+    A fetch carries on if some of the callers waiting for it are cancelled, but is cancelled once all of them are.
+    """
+
+    __slots__ = ("max_size", "ttl", "hits", "misses", "_items", "_in_flight")
+
+    def __init__(self, *, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict[KT, tuple[float, VT]]()
+        self._in_flight: dict[KT, _InFlight[VT]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} hits={self.hits} misses={self.misses} size={len(self._items)}>"
+
+    def info(self) -> CacheInfo:
+        """The cache's statistics."""
+        return CacheInfo(self.hits, self.misses, len(self._items), self.max_size)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self._items.clear()
+
+    def _copy(self, value: VT) -> VT:
+        return value
+
+    def _get(self, key: KT) -> VT | None:
+        try:
+            expires, value = self._items[key]
+        except KeyError:
+            return None
+        if expires < time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return self._copy(value)
+
+    def _put(self, key: KT, value: VT) -> None:
+        self._items[key] = (time.monotonic() + self.ttl, self._copy(value))
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    async def _fetch(self, key: KT, fetch: Callable[[], Awaitable[VT]]) -> VT:
+        if (value := self._get(key)) is not None:
+            self.hits += 1
+            return value
+
+        try:
+            in_flight = self._in_flight[key]
+        except KeyError:
+            self.misses += 1
+            in_flight = self._in_flight[key] = _InFlight(asyncio.ensure_future(fetch()))
+            in_flight.future.add_done_callback(partial(self._finish, key, in_flight))
+        else:
+            self.hits += 1
+
+        in_flight.waiters += 1
+        try:
+            return self._copy(await asyncio.shield(in_flight.future))
+        except asyncio.CancelledError:
+            if in_flight.waiters == 1 and not in_flight.future.done():  # nothing else wants it, so stop fetching it
+                self._discard(key, in_flight)
+                in_flight.future.cancel()
+            raise
+        finally:
+            in_flight.waiters -= 1
+
+    def _discard(self, key: KT, in_flight: _InFlight[VT]) -> None:
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+
+    def _finish(self, key: KT, in_flight: _InFlight[VT], future: asyncio.Future[VT]) -> None:
+        self._discard(key, in_flight)
+        if not future.cancelled() and future.exception() is None:
+            self._put(key, future.result())
+
+
+class ProfileCache(TTLCache[int, "cstrike.PlayersProfile"]):
+    """A bounded cache of CSGO profiles that also makes sure only one fetch for a user is in flight at a time.
+
+    A cache can be shared between clients by passing the same instance as each :class:`Client`'s ``profile_cache``.
+
+    Parameters
+    ----------
+    max_size
+        The maximum number of profiles to keep, the least recently used profiles are evicted first.
+    ttl
+        How long in seconds a profile is kept for.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 300.0):
+        super().__init__(max_size=max_size, ttl=ttl)
+
+    def get(self, user_id: int) -> cstrike.PlayersProfile | None:
+        """Get the cached profile of the user with the 32-bit account ID ``user_id``."""
+        return self._get(user_id)
+
+    def put(self, user_id: int, profile: cstrike.PlayersProfile) -> None:
+        """Cache ``profile`` as the profile of the user with the 32-bit account ID ``user_id``."""
+        self._put(user_id, profile)
+
+    async def fetch(
+        self, user_id: int, fetch: Callable[[], Awaitable[cstrike.PlayersProfile]]
+    ) -> cstrike.PlayersProfile:
+        """Return the cached profile for ``user_id``, joining a fetch already in flight for it or calling ``fetch`` if
+        there isn't one.
+        """
+        return await self._fetch(user_id, fetch)
@@ -0,0 +1,161 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from ... import utils
+from ...types.id import AssetID
+from .attributes import DecodedAttributes, decode_attributes, merge_attributes
+from .backpack import CasketItem, Paint
+from .protobufs import base
+
+if TYPE_CHECKING:
+    from .state import GCState
+
+
+class _CasketItemView(CasketItem):
+    # a CasketItem built from the store's columns, everything that isn't in them is parsed the first time it's used
+    __slots__ = ("_data",)
+    _data: bytes | None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name == "_data" or self._data is None:
+            raise AttributeError(f"{CasketItem.__name__!r} object has no attribute {name!r}")
+        data, self._data = self._data, None
+        gc_item = base.Item().parse(data)
+        utils.update_class(gc_item, self)
+        merge_attributes(self, gc_item, decode_attributes(gc_item.attribute))
+        return getattr(self, name)
+
+    def __repr__(self) -> str:
+        return f"<{CasketItem.__name__} id={self.id} casket={self.casket}>"
+
+
+class CasketItemStore(Mapping[AssetID, CasketItem]):
+    """Stores the items inside of caskets column by column.
+
+    Only the columns and each item's serialised form are kept. Looking an item up returns a :class:`CasketItem` whose
+    ID, def index and paint come from the columns, the rest of it is only parsed if it's used.
+    """
+
+    __slots__ = (
+        "_state",
+        "_indices",
+        "_by_casket",
+        "_data",
+        "ids",
+        "casket_ids",
+        "def_indices",
+        "paint_indices",
+        "paint_seeds",
+        "paint_wears",
+    )
+
+    def __init__(self, state: GCState):
+        self._state = state
+        self._indices: dict[AssetID, int] = {}
+        self._by_casket: dict[AssetID, set[AssetID]] = {}
+        self._data: list[bytes] = []
+        self.ids = array("Q")
+        self.casket_ids = array("Q")
+        self.def_indices = array("I")
+        self.paint_indices = array("f")  # the paint columns are NaN if the item doesn't have that attribute
+        self.paint_seeds = array("f")
+        self.paint_wears = array("f")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[AssetID]:
+        return iter(self._indices)
+
+    def __contains__(self, asset_id: object) -> bool:
+        return asset_id in self._indices
+
+    def __getitem__(self, asset_id: AssetID) -> CasketItem:
+        idx = self._indices[asset_id]
+        item = _CasketItemView()
+        item._data = self._data[idx]
+        item._state = self._state
+        item._casket_id = AssetID(self.casket_ids[idx])
+        item.id = asset_id
+        item.def_index = self.def_indices[idx]
+        paint_index, paint_seed, paint_wear = self.paint_indices[idx], self.paint_seeds[idx], self.paint_wears[idx]
+        if not (math.isnan(paint_index) and math.isnan(paint_seed) and math.isnan(paint_wear)):
+            item.paint = Paint(  # the same as DecodedAttributes.paint
+                index=0 if math.isnan(paint_index) else paint_index,
+                seed=0 if math.isnan(paint_seed) else int(paint_seed),
+                wear=0 if math.isnan(paint_wear) else paint_wear,
+            )
+        return item
+
+    def in_casket(self, casket_id: AssetID) -> list[CasketItem]:
+        """The items stored in the casket with ``casket_id``."""
+        return [self[asset_id] for asset_id in self._by_casket.get(casket_id, ())]
+
+    def count_in_casket(self, casket_id: AssetID) -> int:
+        """The number of items we know are stored in the casket with ``casket_id``."""
+        return len(self._by_casket.get(casket_id, ()))
+
+    def _index(self, asset_id: AssetID, casket_id: AssetID) -> None:
+        try:
+            self._by_casket[casket_id].add(asset_id)
+        except KeyError:
+            self._by_casket[casket_id] = {asset_id}
+
+    def _unindex(self, asset_id: AssetID, casket_id: AssetID) -> None:
+        contents = self._by_casket[casket_id]
+        contents.discard(asset_id)
+        if not contents:
+            del self._by_casket[casket_id]
+
+    def _add(
+        self, gc_item: base.Item, casket_id: AssetID, attributes: DecodedAttributes, data: bytes | None = None
+    ) -> None:
+        values = (
+            casket_id,
+            gc_item.def_index,
+            math.nan if attributes.paint_index is None else attributes.paint_index,
+            math.nan if attributes.paint_seed is None else math.floor(attributes.paint_seed),
+            math.nan if attributes.paint_wear is None else attributes.paint_wear,
+        )
+        if data is None:
+            data = bytes(gc_item)
+        asset_id = AssetID(gc_item.id)
+        try:
+            idx = self._indices[asset_id]
+        except KeyError:
+            self._index(asset_id, casket_id)
+            self._indices[asset_id] = len(self._data)
+            self._data.append(data)
+            for column, value in zip(self._columns, (gc_item.id, *values)):
+                column.append(value)
+        else:
+            if (old_casket_id := AssetID(self.casket_ids[idx])) != casket_id:
+                self._unindex(asset_id, old_casket_id)
+                self._index(asset_id, casket_id)
+            self._data[idx] = data
+            for column, value in zip(self._columns[1:], values):
+                column[idx] = value
+
+    @property
+    def _columns(self) -> tuple[array[int] | array[float], ...]:
+        return self.ids, self.casket_ids, self.def_indices, self.paint_indices, self.paint_seeds, self.paint_wears
+
+    def _remove(self, asset_id: AssetID) -> None:
+        idx = self._indices.pop(asset_id)
+        self._unindex(asset_id, AssetID(self.casket_ids[idx]))
+        last = len(self._data) - 1
+        if idx != last:  # move the last item into the removed item's place so nothing needs shifting
+            self._indices[AssetID(self.ids[last])] = idx
+            self._data[idx] = self._data[last]
+            for column in self._columns:
+                column[idx] = column[last]
+
+        self._data.pop()
+        for column in self._columns:
+            column.pop()
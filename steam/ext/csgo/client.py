@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING, Any, Final, overload
 
 from typing_extensions import Self
 
-from ..._const import timeout
 from ..._gc import Client as Client_
 from ...app import CSGO
 from ...enums import Type
@@ -16,7 +15,7 @@ from ...ext import commands
 from ...id import ID
 from ...types.id import Intable
 from ...utils import cached_property
-from .backpack import Paint, Sticker
+from .backpack import BaseInspectedItem, Paint, Sticker
 from .enums import ItemOrigin, ItemQuality
 from .models import ClientUser, MatchInfo, User
 from .protobufs import cstrike
@@ -25,7 +24,8 @@ from .state import GCState
 if TYPE_CHECKING:
     from ...ext import csgo
     from ...types.user import IndividualID
-    from .backpack import BaseInspectedItem
+    from .inspect_cache import InspectCache
+    from .inspect_store import InspectStore
 
 
 __all__ = (
@@ -34,12 +34,57 @@ __all__ = (
 )
 
 
+def _parse_inspect_url(url: str) -> tuple[IndividualID, int, int, int]:  # (owner, asset_id, d, market_id)
+    search = re.search(r"[SM](\d+)A(\d+)D(\d+)$", url)
+    if search is None:
+        raise ValueError("Inspect url is invalid")
+
+    owner = ID(int(search[1]) if search[0].startswith("S") else 0, type=Type.Individual)
+    market_id = int(search[1]) if search[0].startswith("M") else 0
+    return owner, int(search[2]), int(search[3]), market_id
+
+
 class Client(Client_):
     """Represents a client connection that connects to Steam. This class is used to interact with the Steam API, CMs
     and the CSGO Game Coordinator.
 
     :class:`Client` is a subclass of :class:`steam.Client`, so whatever you can do with :class:`steam.Client` you can
     do with :class:`Client`.
+
+    Parameters
+    ----------
+    inspect_cache
+        The :class:`InspectCache` to cache inspected items in, pass the same one to several clients to share it.
+    profile_cache
+        The :class:`ProfileCache` to cache fetched CSGO profiles in, pass the same one to several clients to share it.
+    inspect_store
+        The :class:`InspectStore` to persist inspected items in, it's checked before the GC is asked to inspect an
+        item.
+    gc_request_timeout
+        How long in seconds to wait for the GC to respond to a request before sending it again.
+    gc_request_retries
+        How many times to resend a request the GC hasn't responded to. Requests that change something, like renaming
+        an item or moving it to or from a casket, are never resent.
+    gc_heartbeat
+        Whether the client should send its own GC heartbeats, a :class:`Fleet` sends them for all of its clients.
+    gc_send_rates
+        A mapping of GC message types to ``(messages per second, burst)`` to override the default rate limits for
+        sending them with.
+    gc_max_pending_sends
+        The maximum number of messages that can be waiting to be sent to the GC before senders have to wait.
+    gc_instrumentation
+        A :class:`GCInstrumentation`, like :class:`GCMetrics`, to call as GC messages are received, parsed and
+        dispatched. By default nothing is measured.
+    backpack_snapshot_path
+        A file to keep a snapshot of the client's backpack in. If it's passed, the backpack is restored from the
+        snapshot when the client next connects to the GC and only what changed since it was written is fetched. Use a
+        different file for each account.
+    cache_decode_executor
+        A :class:`concurrent.futures.ThreadPoolExecutor` or :class:`concurrent.futures.ProcessPoolExecutor` to decode
+        large SO caches in, so the event loop is only blocked while the decoded items are merged in to the backpack.
+        A process pool is best when many clients run in the same process.
+    cache_decode_threshold
+        The number of items a cache needs to have before it's decoded in ``cache_decode_executor``. Defaults to 500.
     """
 
     _APP: Final = CSGO  # type: ignore
@@ -48,6 +93,22 @@ class Client(Client_):
     _state: GCState
     _GC_HEART_BEAT = 10.0
 
+    @property
+    def inspect_cache(self) -> InspectCache:
+        """The cache of items inspected by :meth:`inspect_item`."""
+        return self._state.inspect_cache
+
+    @property
+    def inspect_store(self) -> InspectStore | None:
+        """The persistent store of items inspected by :meth:`inspect_item`, if one was passed."""
+        return self._state.inspect_store
+
+    async def close(self) -> None:
+        try:
+            await self._state.save_backpack_snapshot()
+        finally:
+            await super().close()
+
     @overload
     async def inspect_item(self, *, owner: IndividualID, asset_id: int, d: int) -> BaseInspectedItem:
         ...
@@ -86,41 +147,39 @@ class Client(Client_):
         """
 
         if url:
-            search = re.search(r"[SM](\d+)A(\d+)D(\d+)$", url)
-            if search is None:
-                raise ValueError("Inspect url is invalid")
-
-            owner = ID(int(search[1]) if search[0].startswith("S") else 0, type=Type.Individual)
-            market_id = int(search[1]) if search[0].startswith("M") else 0
-            asset_id = int(search[2])
-            d = int(search[3])
-
+            owner, asset_id, d, market_id = _parse_inspect_url(url)
         elif owner is None and market_id == 0:
             raise TypeError("Missing required keyword-only argument: 'owner' or 'market_id'")
         elif d == 0 or asset_id == 0:
             raise TypeError(f"Missing required keyword-only argument: {'asset_id' if d else 'd'}")
 
-        future = self.ws.gc_wait_for(
-            cstrike.Client2GcEconPreviewDataBlockResponse,
-            check=lambda msg: isinstance(msg, cstrike.Client2GcEconPreviewDataBlockResponse)
-            and msg.iteminfo.itemid == asset_id,
+        return await self._state.inspect_cache.fetch(
+            asset_id, d, lambda: self._inspect_item(owner=owner, asset_id=asset_id, d=d, market_id=market_id)
         )
-        await self._state.ws.send_gc_message(
+
+    async def _inspect_item(
+        self, *, owner: IndividualID | None, asset_id: int, d: int, market_id: int
+    ) -> BaseInspectedItem:
+        store = self._state.inspect_store
+        if store is not None and (stored := await store.get(asset_id, d)) is not None:
+            return stored
+
+        msg = await self._state.gc_request(
             cstrike.Client2GcEconPreviewDataBlockRequest(
                 param_s=owner.id64 if owner else 0,
                 param_a=asset_id,
                 param_d=d,
                 param_m=market_id,
-            )
+            ),
+            cstrike.Client2GcEconPreviewDataBlockResponse,
+            check=lambda msg: msg.iteminfo.itemid == asset_id,
         )
 
-        msg = await future
-
         item = msg.iteminfo
         # decode the wear
         packed_wear = struct.pack(">l", item.paintwear)
         (paint_wear,) = struct.unpack(">f", packed_wear)
-        return BaseInspectedItem(
+        inspected = BaseInspectedItem(
             id=item.itemid,
             def_index=item.defindex,
             paint=Paint(index=item.paintindex, wear=paint_wear, seed=item.paintseed),
@@ -147,15 +206,18 @@ class Client(Client_):
             music_index=item.musicindex,
             ent_index=item.entindex,
         )
+        if store is not None:
+            await store.put(d, inspected)
+        return inspected
 
     async def fetch_match(self, id: int, *, outcome_id: int, token: int) -> MatchInfo:
         """Fetch a match by its id."""
-        future = self.ws.gc_wait_for(
-            cstrike.MatchInfo, check=lambda msg: isinstance(msg, cstrike.MatchList) and msg.matchid == id
+        msg = await self._state.gc_request(
+            cstrike.MatchListRequestFullGameInfo(id, outcome_id, token),
+            cstrike.MatchList,
+            check=lambda msg: bool(msg.matches) and msg.matches[0].matchid == id,
         )
-        await self.ws.send_gc_message(cstrike.MatchListRequestFullGameInfo(id, outcome_id, token))
-        async with timeout(30):
-            return MatchInfo(self._state, await future)
+        return MatchInfo(self._state, msg.matches[0])
 
     if TYPE_CHECKING:
 
@@ -222,6 +284,16 @@ class Client(Client_):
                 The item now.
             """
 
+        async def on_item_update_many(self, items: list[tuple[csgo.BackpackItem, csgo.BackpackItem]]) -> None:
+            """Called once for every batch of items updated in the client's backpack, after :meth:`on_item_update` has
+            been called for each of them.
+
+            Parameters
+            ----------
+            items
+                The ``(before, after)`` pairs of the updated items.
+            """
+
 
 class Bot(commands.Bot, Client):
     """Represents a Steam bot.
@@ -0,0 +1,32 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+from .protobufs import _fast
+
+__all__ = (
+    "use_fast_decoders",
+    "fast_decoders_enabled",
+)
+
+
+def use_fast_decoders(enabled: bool = True) -> None:
+    """Set whether items and the other messages that make up the SO cache are parsed with the fast decoders.
+
+    The fast decoders are hand-written and produce the same messages as betterproto, they aren't used until this is
+    called. This applies to every client in the process.
+
+    Parameters
+    ----------
+    enabled
+        Whether to use the fast decoders.
+    """
+    if enabled:
+        _fast.install()
+    else:
+        _fast.uninstall()
+
+
+def fast_decoders_enabled() -> bool:
+    """Whether the fast decoders are being used, see :func:`use_fast_decoders`."""
+    return _fast.installed()
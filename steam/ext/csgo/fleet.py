@@ -0,0 +1,211 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import zlib
+from collections.abc import Iterable, Mapping
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from .cache import ProfileCache
+from .client import Client
+from .inspect_cache import InspectCache
+from .inspect_pool import InspectPool
+
+if TYPE_CHECKING:
+    from ...enums import Language
+    from ...types.trade import DescriptionDict
+    from .inspect_store import InspectStore
+
+__all__ = ("Fleet",)
+
+log = logging.getLogger(__name__)
+
+
+class Fleet:
+    """Runs many clients on one event loop, sharing their caches and heartbeat.
+
+    Logins are staggered by ``login_interval`` and clients that stop are logged in again with an exponential back off.
+    Every client shares the fleet's :class:`InspectCache`, :class:`ProfileCache`, :class:`InspectStore` and item
+    descriptions.
+
+    To spread accounts over several processes give each one the same ``accounts`` and a different ``shard``, each
+    process then only runs the accounts that hash to its shard.
+
+    Parameters
+    ----------
+    accounts
+        The keyword arguments to pass to :meth:`Client.login` for each account.
+    client
+        The :class:`Client` subclass to create the clients with.
+    login_interval
+        How long in seconds to wait between starting each login.
+    shard
+        The shard this process runs.
+    shard_count
+        The total number of shards.
+    inspect_cache
+        The :class:`InspectCache` to share, one is created if this isn't passed.
+    profile_cache
+        The :class:`ProfileCache` to share, one is created if this isn't passed.
+    inspect_store
+        An :class:`InspectStore` to share.
+    options
+        Any other options to create each client with.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Mapping[str, Any]],
+        *,
+        client: type[Client] = Client,
+        login_interval: float = 10.0,
+        shard: int = 0,
+        shard_count: int = 1,
+        inspect_cache: InspectCache | None = None,
+        profile_cache: ProfileCache | None = None,
+        inspect_store: InspectStore | None = None,
+        **options: Any,
+    ):
+        if not 0 <= shard < shard_count:
+            raise ValueError("shard must be between 0 and shard_count")
+        self.accounts = [account for account in accounts if self.shard_of(account, shard_count) == shard]
+        self.client_cls = client
+        self.login_interval = login_interval
+        self.inspect_cache = inspect_cache if inspect_cache is not None else InspectCache()
+        self.profile_cache = profile_cache if profile_cache is not None else ProfileCache()
+        self.inspect_store = inspect_store
+        self.descriptions: dict[tuple[Language | None, str, str], DescriptionDict] = {}
+        self.options = options
+        self.inspect_pool = InspectPool(inspect_cache=self.inspect_cache)
+        self._clients: dict[int, Client] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._ready_changed = asyncio.Event()
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} clients={len(self._clients)} ready={len(self.ready_clients)}>"
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    @staticmethod
+    def shard_of(account: Mapping[str, Any], shard_count: int) -> int:
+        """The shard ``account`` belongs to, this is stable across processes and the order of the accounts."""
+        key = account.get("username") or account.get("refresh_token") or ""
+        return zlib.crc32(str(key).encode()) % shard_count
+
+    @property
+    def clients(self) -> list[Client]:
+        """The fleet's clients."""
+        return list(self._clients.values())
+
+    @property
+    def ready_clients(self) -> list[Client]:
+        """The fleet's clients that are ready to make GC requests."""
+        return [
+            client for client in self._clients.values() if not client.is_closed() and client._state._gc_ready.is_set()
+        ]
+
+    def is_ready(self) -> bool:
+        """Whether every client in the fleet is ready."""
+        return len(self.ready_clients) == len(self.accounts)
+
+    async def wait_until_ready(self, count: int | None = None) -> None:
+        """Wait until ``count`` clients are ready, by default waits for all of them."""
+        count = len(self.accounts) if count is None else count
+        while len(self.ready_clients) < count:
+            self._ready_changed.clear()
+            await self._ready_changed.wait()
+
+    async def start(self) -> None:
+        """Start logging the fleet's clients in."""
+        if self._tasks:
+            raise RuntimeError("Fleet has already been started")
+        self._tasks = [
+            asyncio.create_task(self._run(idx, account), name=f"steam.py fleet account {idx}")
+            for idx, account in enumerate(self.accounts)
+        ]
+        self._tasks.append(asyncio.create_task(self._heartbeat(), name="steam.py fleet heartbeat"))
+
+    async def close(self) -> None:
+        """Close every client and stop logging them in again."""
+        self._closed = True
+        await asyncio.gather(*(client.close() for client in self._clients.values()), return_exceptions=True)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _create_client(self) -> Client:
+        return self.client_cls(
+            **self.options,
+            inspect_cache=self.inspect_cache,
+            profile_cache=self.profile_cache,
+            inspect_store=self.inspect_store,
+            description_cache=self.descriptions,
+            gc_heartbeat=False,
+        )
+
+    async def _run(self, idx: int, account: Mapping[str, Any]) -> None:
+        await asyncio.sleep(idx * self.login_interval)
+        loop = asyncio.get_running_loop()
+        backoff = self.login_interval
+        while not self._closed:
+            started_at = loop.time()
+            client = self._clients[idx] = self._create_client()
+            self.inspect_pool.add(client)
+            watcher = asyncio.create_task(self._watch(client))
+            try:
+                await client.login(**account)
+            except Exception:
+                log.exception("Client for account %d stopped", idx)
+            finally:
+                watcher.cancel()
+                self.inspect_pool.remove(client)
+                if not client.is_closed():
+                    await client.close()
+                self._ready_changed.set()
+
+            if self._closed:
+                return
+            if loop.time() - started_at > 300.0:  # it was running fine for a while
+                backoff = self.login_interval
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 300.0)
+
+    async def _watch(self, client: Client) -> None:
+        while True:
+            await client.wait_for_gc_ready()
+            self._ready_changed.set()
+            await client.wait_for("gc_disconnect")
+            self._ready_changed.set()
+
+    async def _heartbeat(self) -> None:
+        # one loop for the whole fleet rather than a task per client, each send is its own task though so a slow client
+        # doesn't hold up everyone else's heartbeat. A client whose last heartbeat is still being sent is skipped
+        sending: dict[Client, asyncio.Task[None]] = {}
+        try:
+            while True:
+                for client in self._clients.values():
+                    if client in sending or client.is_closed() or not client._state.login_complete.is_set():
+                        continue
+                    task = sending[client] = asyncio.create_task(client._send_gc_heartbeat())
+                    task.add_done_callback(partial(self._heartbeat_sent, sending, client))
+                await asyncio.sleep(self.client_cls._GC_HEART_BEAT)
+        finally:
+            for task in sending.values():
+                task.cancel()
+
+    @staticmethod
+    def _heartbeat_sent(sending: dict[Client, asyncio.Task[None]], client: Client, task: asyncio.Task[None]) -> None:
+        del sending[client]
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            log.debug("Failed to send a heartbeat for %r", client, exc_info=exc)
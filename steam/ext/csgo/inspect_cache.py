@@ -0,0 +1,57 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from .cache import CacheInfo, TTLCache
+
+if TYPE_CHECKING:
+    from .backpack import BaseInspectedItem
+
+__all__ = (
+    "InspectCache",
+    "InspectCacheInfo",
+)
+
+InspectCacheInfo = CacheInfo
+
+
+class InspectCache(TTLCache[tuple[int, int], "BaseInspectedItem"]):
+    """A bounded cache of inspected items that also makes sure only one inspect for an item is in flight at a time.
+
+    A cache can be shared between clients by passing the same instance as each :class:`Client`'s ``inspect_cache``.
+
+    Parameters
+    ----------
+    max_size
+        The maximum number of items to keep, the least recently used items are evicted first.
+    ttl
+        How long in seconds an item is kept for.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 600.0):
+        super().__init__(max_size=max_size, ttl=ttl)
+
+    def _copy(self, value: BaseInspectedItem) -> BaseInspectedItem:
+        return copy.copy(value)  # inspecting a BackpackItem mutates the returned item
+
+    def get(self, asset_id: int, d: int) -> BaseInspectedItem | None:
+        """Get the cached result of inspecting the item with ``asset_id`` and ``d``."""
+        return self._get((asset_id, d))
+
+    def put(self, asset_id: int, d: int, item: BaseInspectedItem) -> None:
+        """Cache ``item`` as the result of inspecting the item with ``asset_id`` and ``d``."""
+        self._put((asset_id, d), item)
+
+    async def fetch(
+        self, asset_id: int, d: int, inspect: Callable[[], Awaitable[BaseInspectedItem]]
+    ) -> BaseInspectedItem:
+        """Return the cached item for ``asset_id`` and ``d``, joining an inspect already in flight for it or calling
+        ``inspect`` if there isn't one.
+        """
+        return await self._fetch((asset_id, d), inspect)
@@ -0,0 +1,198 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from ..._gc.scheduler import TokenBucket
+from .client import _parse_inspect_url
+from .inspect_cache import InspectCache
+
+if TYPE_CHECKING:
+    from ...types.user import IndividualID
+    from .backpack import BaseInspectedItem
+    from .client import Client
+
+__all__ = ("InspectPool",)
+
+log = logging.getLogger(__name__)
+
+
+class _PooledClient:
+    __slots__ = ("client", "bucket", "in_flight")
+
+    def __init__(self, client: Client, bucket: TokenBucket):
+        self.client = client
+        self.bucket = bucket
+        self.in_flight = 0
+
+    @property
+    def healthy(self) -> bool:
+        return not self.client.is_closed() and self.client._state._gc_ready.is_set()
+
+
+class _ClientLost(Exception):
+    pass
+
+
+class InspectPool:
+    """A pool of logged in clients that inspects items on whichever client is the least loaded.
+
+    Each client has its own token bucket, so requests are spread over the pool without any one client going over
+    ``rate``. Clients that aren't ready for GC requests are skipped until they are, and inspects that were in flight
+    on a client when it disconnected from the GC are cancelled and retried on another.
+
+    Inspects for the same item are deduplicated with ``inspect_cache`` rather than the clients' own caches, so a retry
+    never waits on the attempt it replaced.
+
+    Parameters
+    ----------
+    clients
+        The clients to inspect with.
+    rate
+        The number of inspects per second each client can make.
+    burst
+        The number of inspects each client can make at once before being held to ``rate``.
+    timeout
+        How long in seconds to wait for one client to inspect an item before retrying on another.
+    retries
+        The number of times to retry an inspect on another client.
+    inspect_cache
+        The :class:`InspectCache` to cache inspected items in, one is created if this isn't passed.
+    """
+
+    __slots__ = ("rate", "burst", "timeout", "retries", "inspect_cache", "_clients", "_changed")
+
+    def __init__(
+        self,
+        clients: Iterable[Client] = (),
+        *,
+        rate: float = 1.0,
+        burst: int = 1,
+        timeout: float = 10.0,
+        retries: int = 3,
+        inspect_cache: InspectCache | None = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.retries = retries
+        self.inspect_cache = inspect_cache if inspect_cache is not None else InspectCache()
+        self._clients: dict[Client, _PooledClient] = {}
+        self._changed = asyncio.Event()
+        for client in clients:
+            self.add(client)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} clients={len(self._clients)} ready={len(self.ready_clients)}>"
+
+    @property
+    def clients(self) -> list[Client]:
+        """The clients in the pool."""
+        return list(self._clients)
+
+    @property
+    def ready_clients(self) -> list[Client]:
+        """The clients in the pool that are ready to inspect items."""
+        return [pooled.client for pooled in self._clients.values() if pooled.healthy]
+
+    def add(self, client: Client) -> None:
+        """Add a client to the pool."""
+        self._clients[client] = _PooledClient(client, TokenBucket(self.rate, self.burst))
+        self._changed.set()
+
+    def remove(self, client: Client) -> None:
+        """Remove a client from the pool."""
+        del self._clients[client]
+
+    async def close(self) -> None:
+        """Close every client in the pool."""
+        await asyncio.gather(*(client.close() for client in self._clients), return_exceptions=True)
+
+    async def inspect(self, url: str) -> BaseInspectedItem:
+        """Inspect the item with the inspect ``url`` on the least loaded ready client.
+
+        Parameters
+        ----------
+        url
+            The item's inspect url.
+
+        Raises
+        ------
+        ValueError
+            The inspect url is invalid.
+        TimeoutError
+            The item couldn't be inspected within ``retries`` attempts.
+        """
+        owner, asset_id, d, market_id = _parse_inspect_url(url)
+        return await self.inspect_cache.fetch(
+            asset_id, d, lambda: self._inspect(url, owner=owner, asset_id=asset_id, d=d, market_id=market_id)
+        )
+
+    async def _inspect(
+        self, url: str, *, owner: IndividualID, asset_id: int, d: int, market_id: int
+    ) -> BaseInspectedItem:
+        for attempt in range(self.retries + 1):
+            pooled = await self._acquire()
+            pooled.in_flight += 1
+            try:
+                return await self._inspect_on(pooled, owner=owner, asset_id=asset_id, d=d, market_id=market_id)
+            except (asyncio.TimeoutError, _ClientLost):
+                log.info("Inspect of %r failed on %r, attempt %d", url, pooled.client, attempt + 1)
+            finally:
+                pooled.in_flight -= 1
+
+        raise asyncio.TimeoutError(f"Failed to inspect {url!r} after {self.retries + 1} attempts")
+
+    async def _acquire(self) -> _PooledClient:
+        while True:
+            healthy = [pooled for pooled in self._clients.values() if pooled.healthy]
+            if not healthy:
+                await self._wait_for_ready()
+                continue
+
+            pooled = min(healthy, key=lambda pooled: (pooled.bucket.delay(), pooled.in_flight))
+            if delay := pooled.bucket.reserve():
+                await asyncio.sleep(delay)
+            if pooled.healthy:
+                return pooled
+
+    async def _wait_for_ready(self) -> None:
+        self._changed.clear()
+        # a closed client can still look ready, so waiting on one would return straight away
+        waiters = [
+            asyncio.create_task(client.wait_for_gc_ready()) for client in self._clients if not client.is_closed()
+        ]
+        waiters.append(asyncio.create_task(self._changed.wait()))
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _inspect_on(
+        self, pooled: _PooledClient, *, owner: IndividualID, asset_id: int, d: int, market_id: int
+    ) -> BaseInspectedItem:
+        # skip the client's own cache, its in flight inspects are shielded so cancelling this wouldn't stop the request
+        inspect = asyncio.create_task(
+            pooled.client._inspect_item(owner=owner, asset_id=asset_id, d=d, market_id=market_id)
+        )
+        disconnect = asyncio.create_task(pooled.client.wait_for("gc_disconnect"))
+        try:
+            done, _ = await asyncio.wait(
+                (inspect, disconnect), timeout=self.timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            disconnect.cancel()
+            if not inspect.done():
+                inspect.cancel()  # stops the request being resent or holding a rate limit token
+                await asyncio.wait((inspect,))
+
+        if inspect in done:
+            return inspect.result()
+        if disconnect in done:
+            raise _ClientLost
+        raise asyncio.TimeoutError
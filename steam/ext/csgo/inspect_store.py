@@ -0,0 +1,158 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from .backpack import BaseInspectedItem, Paint, Sticker
+from .enums import ItemOrigin, ItemQuality
+
+__all__ = ("InspectStore",)
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inspected_items (
+    asset_id INTEGER NOT NULL,
+    d INTEGER NOT NULL,
+    inspected_at REAL NOT NULL,
+    def_index INTEGER NOT NULL,
+    paint_index INTEGER NOT NULL,
+    paint_seed INTEGER NOT NULL,
+    paint_wear REAL NOT NULL,
+    stickers TEXT NOT NULL,
+    extra TEXT NOT NULL,
+    PRIMARY KEY (asset_id, d)
+) WITHOUT ROWID
+"""
+_SELECT = """
+SELECT inspected_at, def_index, paint_index, paint_seed, paint_wear, stickers, extra
+FROM inspected_items
+WHERE asset_id = ? AND d = ?
+"""
+_EXTRA_ATTRS = (
+    "rarity",
+    "kill_eater_score_type",
+    "kill_eater_value",
+    "custom_name",
+    "inventory",
+    "quest_id",
+    "drop_reason",
+    "music_index",
+    "ent_index",
+)
+
+
+def _to_signed(value: int) -> int:
+    # asset IDs and Ds are unsigned 64-bit but SQLite's integers are signed, so store the same bits as a signed integer
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class InspectStore:
+    """A persistent store of inspected items backed by an SQLite database.
+
+    The database is opened in WAL mode so several processes on one host can share a store. Pass an instance as a
+    :class:`Client`'s ``inspect_store`` to have :meth:`Client.inspect_item` and :meth:`BackpackItem.inspect` check it
+    before asking the GC.
+
+    Parameters
+    ----------
+    path
+        The path to the database, it's created if it doesn't exist.
+    max_age
+        How long in seconds an inspected item is valid for, by default items never expire.
+    """
+
+    __slots__ = ("path", "max_age", "_connection", "_lock")
+
+    def __init__(self, path: str | os.PathLike[str], *, max_age: float | None = None):
+        self.path = path
+        self.max_age = max_age
+        self._connection = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r}>"
+
+    async def get(self, asset_id: int, d: int) -> BaseInspectedItem | None:
+        """Get the stored result of inspecting the item with ``asset_id`` and ``d``."""
+        try:
+            return await asyncio.to_thread(self._get, asset_id, d)
+        except sqlite3.Error:
+            log.warning("Failed to read inspected item %s from %r", asset_id, self, exc_info=True)
+            return None
+
+    async def put(self, d: int, item: BaseInspectedItem) -> None:
+        """Store ``item`` as the result of inspecting its asset ID with ``d``."""
+        try:
+            await asyncio.to_thread(self._put, d, item)
+        except sqlite3.Error:
+            log.warning("Failed to store inspected item %s in %r", item.id, self, exc_info=True)
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, asset_id: int, d: int) -> BaseInspectedItem | None:
+        with self._lock:
+            row = self._connection.execute(_SELECT, (_to_signed(asset_id), _to_signed(d))).fetchone()
+        if row is None:
+            return None
+        inspected_at, def_index, paint_index, paint_seed, paint_wear, stickers, extra_json = row
+        if self.max_age is not None and inspected_at + self.max_age < time.time():
+            return None
+
+        extra: dict[str, Any] = json.loads(extra_json)
+        return BaseInspectedItem(
+            id=asset_id,
+            def_index=def_index,
+            # stores made before these columns were INTEGER return them as floats
+            paint=Paint(index=int(paint_index), seed=int(paint_seed), wear=paint_wear),
+            quality=ItemQuality.try_value(extra.pop("quality")),
+            origin=ItemOrigin.try_value(extra.pop("origin")),
+            stickers=[Sticker(**sticker) for sticker in json.loads(stickers)],
+            **extra,
+        )
+
+    def _put(self, d: int, item: BaseInspectedItem) -> None:
+        stickers = [
+            {
+                "slot": sticker.slot,
+                "id": sticker.id,
+                "wear": sticker.wear,
+                "rotation": sticker.rotation,
+                "scale": sticker.scale,
+                "tint_id": sticker.tint_id,
+            }
+            for sticker in item.stickers
+        ]
+        extra = {attr: getattr(item, attr) for attr in _EXTRA_ATTRS}
+        extra["quality"] = int(item.quality)
+        extra["origin"] = int(item.origin)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO inspected_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _to_signed(item.id),
+                    _to_signed(d),
+                    time.time(),
+                    item.def_index,
+                    item.paint.index,
+                    item.paint.seed,
+                    item.paint.wear,
+                    json.dumps(stickers, separators=(",", ":")),
+                    json.dumps(extra, separators=(",", ":")),
+                ),
+            )
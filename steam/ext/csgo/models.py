@@ -82,9 +82,10 @@ class User(PartialUser, user.User):
     __slots__ = ()
 
     async def recent_matches(self) -> Matches:
-        await self._state.ws.send_gc_message(cstrike.MatchListRequestRecentUserGames(accountid=self.id))
-        msg = await self._state.ws.gc_wait_for(
-            cstrike.MatchList, check=lambda msg: isinstance(msg, cstrike.MatchList) and msg.accountid == self.id
+        msg = await self._state.gc_request(
+            cstrike.MatchListRequestRecentUserGames(accountid=self.id),
+            cstrike.MatchList,
+            check=lambda msg: msg.accountid == self.id,
         )
 
         return Matches([MatchInfo(self._state, match) for match in msg.matches], msg.streams, msg.tournamentinfo)
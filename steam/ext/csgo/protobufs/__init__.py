@@ -1,4 +1,4 @@
-from typing import Final
+from typing import Any, Final
 
 import betterproto
 
@@ -7,4 +7,27 @@ APP_ID: Final = 730
 from ....protobufs.msg import GCProtobufMessage
 from . import base as base, cstrike as cstrike, econ as econ, sdk as sdk, struct_messages as struct_messages
 
-[setattr(cls, "_betterproto", betterproto.ProtoClassMetadata(cls)) for cls in GCProtobufMessage.__subclasses__()]
+
+class _DeferredMetadata:
+    # build each message's metadata the first time it's used rather than for every message at import. It's kept by
+    # class instead of being set on the class, so a subclass never inherits another class' metadata
+    __slots__ = ("metadata",)
+
+    def __init__(self) -> None:
+        self.metadata: dict[type[GCProtobufMessage], betterproto.ProtoClassMetadata] = {}
+
+    def __get__(self, instance: GCProtobufMessage | None, owner: type[GCProtobufMessage]) -> Any:
+        try:
+            return self.metadata[owner]
+        except KeyError:
+            metadata = self.metadata[owner] = betterproto.ProtoClassMetadata(owner)
+            return metadata
+
+
+_metadata = _DeferredMetadata()
+[
+    setattr(cls, "_betterproto", _metadata)
+    for cls in GCProtobufMessage.__subclasses__()
+    if cls.__module__.startswith(f"{__name__}.")  # only our messages, other GCs' are left alone
+]
+del _metadata
@@ -0,0 +1,256 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE
+
+Hand-written decoders for the messages that make up the SO cache, these produce the same objects as
+:meth:`betterproto.Message.parse` without going through its reflective field lookups.
+"""
+
+from __future__ import annotations
+
+import copyreg
+import dataclasses
+from typing import Any, Final, TypeAlias, TypeVar
+
+import betterproto
+
+from . import base, sdk
+
+__all__ = (
+    "install",
+    "uninstall",
+    "installed",
+)
+
+MessageT = TypeVar("MessageT", bound=betterproto.Message)
+
+UINT: Final = 0
+INT32: Final = 1
+BOOL: Final = 2
+STRING: Final = 3
+BYTES: Final = 4
+
+WIRE_VARINT: Final = 0
+WIRE_FIXED_64: Final = 1
+WIRE_LEN_DELIM: Final = 2
+WIRE_FIXED_32: Final = 5
+
+FieldSpec: TypeAlias = "tuple[str, int | type[betterproto.Message], bool]"  # (name, kind, repeated)
+
+
+class _Fallback(Exception):
+    """Raised when a message has something in it the fast decoders don't handle, like a packed or mistyped field."""
+
+
+FIELDS: Final[dict[type[betterproto.Message], dict[int, FieldSpec]]] = {
+    base.ItemAttribute: {
+        1: ("def_index", UINT, False),
+        2: ("value", UINT, False),
+        3: ("value_bytes", BYTES, False),
+    },
+    base.ItemEquipped: {
+        1: ("new_class", UINT, False),
+        2: ("new_slot", UINT, False),
+    },
+    base.Item: {
+        1: ("id", UINT, False),
+        2: ("account_id", UINT, False),
+        3: ("inventory", UINT, False),
+        4: ("def_index", UINT, False),
+        5: ("quantity", UINT, False),
+        6: ("level", UINT, False),
+        7: ("quality", UINT, False),
+        8: ("flags", UINT, False),
+        9: ("origin", UINT, False),
+        10: ("custom_name", STRING, False),
+        11: ("custom_description", STRING, False),
+        12: ("attribute", base.ItemAttribute, True),
+        13: ("interior_item", base.Item, False),
+        14: ("in_use", BOOL, False),
+        15: ("style", UINT, False),
+        16: ("original_id", UINT, False),
+        18: ("equipped_state", base.ItemEquipped, True),
+        19: ("rarity", UINT, False),
+    },
+    sdk.IDOwner: {
+        1: ("type", UINT, False),
+        2: ("id", UINT, False),
+    },
+    sdk.MultipleObjectsSingleObject: {
+        1: ("type_id", INT32, False),
+        2: ("object_data", BYTES, False),
+    },
+    sdk.CacheSubscribedSubscribedType: {
+        1: ("type_id", INT32, False),
+        2: ("object_data", BYTES, True),
+    },
+}
+DEFAULTS: Final = {  # what a message's __dict__ looks like after parsing an empty buffer
+    cls: {
+        **dict.fromkeys((field.name for field in dataclasses.fields(cls)), betterproto.PLACEHOLDER),
+        "_serialized_on_wire": True,
+        "_unknown_fields": b"",
+    }
+    for cls in FIELDS
+}
+_ORIGINAL_PARSE: Final = betterproto.Message.parse
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        result |= (byte & 0x7F) << shift
+        pos += 1
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Too many bytes when decoding varint.")
+
+
+def _decode(data: bytes, fields: dict[int, FieldSpec]) -> dict[str, Any]:
+    parsed: dict[str, Any] = {}
+    pos = 0
+    end = len(data)
+    while pos < end:
+        start = pos
+        key = data[pos]
+        if key < 0x80:  # almost every key and varint fits in a single byte
+            pos += 1
+        else:
+            key, pos = _read_varint(data, pos)
+        wire_type = key & 0x7
+
+        if wire_type == WIRE_VARINT:
+            value = data[pos]
+            if value < 0x80:
+                pos += 1
+            else:
+                value, pos = _read_varint(data, pos)
+        elif wire_type == WIRE_LEN_DELIM:
+            length = data[pos]
+            if length < 0x80:
+                pos += 1
+            else:
+                length, pos = _read_varint(data, pos)
+            value = data[pos : pos + length]
+            pos += length
+        elif wire_type == WIRE_FIXED_64:
+            value = data[pos : pos + 8]
+            pos += 8
+        elif wire_type == WIRE_FIXED_32:
+            value = data[pos : pos + 4]
+            pos += 4
+        else:
+            raise _Fallback
+
+        try:
+            name, kind, repeated = fields[key >> 3]
+        except KeyError:
+            parsed["_unknown_fields"] = parsed.get("_unknown_fields", b"") + data[start:pos]
+            continue
+
+        if kind == UINT:
+            if wire_type != WIRE_VARINT:
+                raise _Fallback
+        elif kind == BYTES:
+            if wire_type != WIRE_LEN_DELIM:
+                raise _Fallback
+        elif kind == STRING:
+            if wire_type != WIRE_LEN_DELIM:
+                raise _Fallback
+            value = str(value, "utf-8")
+        elif kind == INT32:
+            if wire_type != WIRE_VARINT:
+                raise _Fallback
+            value = ((value & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
+        elif kind == BOOL:
+            if wire_type != WIRE_VARINT:
+                raise _Fallback
+            value = value > 0
+        else:
+            if wire_type != WIRE_LEN_DELIM:
+                raise _Fallback
+            value = _new(kind, value)
+
+        if repeated:
+            try:
+                parsed[name].append(value)
+            except KeyError:
+                parsed[name] = [value]
+        else:
+            parsed[name] = value
+
+    return parsed
+
+
+def _new(cls: type[MessageT], data: bytes) -> MessageT:
+    message = object.__new__(cls)
+    values = message.__dict__
+    values.update(DEFAULTS[cls])
+    values["_group_current"] = {}
+    values.update(_decode(data, FIELDS[cls]))
+    return message
+
+
+def _parse(self: MessageT, data: bytes) -> MessageT:
+    try:
+        parsed = _decode(data, FIELDS[self.__class__])
+    except _Fallback:
+        return _ORIGINAL_PARSE(self, data)
+
+    values = self.__dict__
+    values["_serialized_on_wire"] = True
+    for name, value in parsed.items():
+        current = values.get(name)
+        if name == "_unknown_fields":
+            values[name] = current + value
+        elif isinstance(current, list):
+            current += value  # repeated fields are appended to like betterproto does
+        else:
+            values[name] = value
+    return self
+
+
+def _rebuild(cls: type[MessageT], values: dict[str, Any]) -> MessageT:
+    message = object.__new__(cls)
+    message.__dict__.update(DEFAULTS[cls])
+    message.__dict__["_group_current"] = {}
+    message.__dict__.update(values)
+    return message
+
+
+def _reduce(message: betterproto.Message) -> tuple[Any, ...]:
+    # betterproto's PLACEHOLDER sentinel doesn't survive pickling and memoryviews can't be pickled, so only send the
+    # fields that have been set, this lets decoded items be sent back from a process pool without being reparsed
+    return _rebuild, (
+        message.__class__,
+        {
+            name: bytes(value) if isinstance(value, memoryview) else value
+            for name, value in message.__dict__.items()
+            if value is not betterproto.PLACEHOLDER and name != "_group_current"
+        },
+    )
+
+
+for cls in FIELDS:  # messages pickle the same however they were parsed, so this doesn't depend on install()
+    copyreg.pickle(cls, _reduce)
+del cls
+
+
+def install() -> None:
+    """Make the messages in :data:`FIELDS` parse with the fast decoders."""
+    for cls in FIELDS:
+        cls.parse = _parse  # type: ignore
+
+
+def uninstall() -> None:
+    """Go back to parsing the messages in :data:`FIELDS` with betterproto."""
+    for cls in FIELDS:
+        if cls.__dict__.get("parse") is _parse:
+            del cls.parse
+
+
+def installed() -> bool:
+    """Whether the messages in :data:`FIELDS` parse with the fast decoders."""
+    return all(cls.__dict__.get("parse") is _parse for cls in FIELDS)
@@ -92,6 +92,22 @@ class CacheSubscriptionRefresh(betterproto.Message):
     owner_soid: "IDOwner" = betterproto.message_field(2)
 
 
+# the top level versions of the messages above, those are nested in ClientWelcome so can't parse a GC header
+class SOCacheSubscribed(GCProtobufMessage, msg=EMsg.SOCacheSubscribed):
+    objects: "list[CacheSubscribedSubscribedType]" = betterproto.message_field(2)
+    version: int = betterproto.fixed64_field(3)
+    owner_soid: "IDOwner" = betterproto.message_field(4)
+
+
+class SOCacheSubscriptionCheck(GCProtobufMessage, msg=EMsg.SOCacheSubscriptionCheck):
+    version: int = betterproto.fixed64_field(2)
+    owner_soid: "IDOwner" = betterproto.message_field(3)
+
+
+class SOCacheSubscriptionRefresh(GCProtobufMessage, msg=EMsg.SOCacheSubscriptionRefresh):
+    owner_soid: "IDOwner" = betterproto.message_field(2)
+
+
 @dataclass(eq=False, repr=False)
 class CacheVersion(betterproto.Message):
     version: int = betterproto.fixed64_field(1)
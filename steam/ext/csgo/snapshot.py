@@ -0,0 +1,65 @@
+"""Licensed under The MIT License (MIT) - Copyright (c) 2020-present James H-B. See LICENSE"""
+
+from __future__ import annotations
+
+import json
+import os
+from base64 import b64decode, b64encode
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from typing_extensions import Self
+
+from .protobufs import base
+
+if TYPE_CHECKING:
+    from ...types.trade import InventoryDict
+
+SNAPSHOT_VERSION: Final = 1
+
+
+@dataclass(slots=True)
+class BackpackSnapshot:
+    """A snapshot of a client's backpack that can be written to disk and used to warm start the next session."""
+
+    owner_id64: int
+    """The 64-bit Steam ID of the backpack's owner."""
+    so_cache_versions: dict[tuple[int, int], int]
+    """The versions of the SO caches :attr:`items` are from."""
+    inventory: InventoryDict
+    """The web inventory the backpack was built from."""
+    items: list[base.Item]
+    """The backpack's and caskets' items as sent by the GC."""
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Self | None:
+        """Load the snapshot at ``path``, returns ``None`` if there isn't a usable one."""
+        try:
+            data: dict[str, Any] = json.loads(Path(path).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        return cls(
+            owner_id64=data["owner_id64"],
+            so_cache_versions={(type, id): version for type, id, version in data["so_cache_versions"]},
+            inventory=data["inventory"],
+            items=[base.Item().parse(b64decode(item)) for item in data["items"]],
+        )
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write this snapshot to ``path``, replacing the old snapshot atomically."""
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "owner_id64": self.owner_id64,
+            "so_cache_versions": [[type, id, version] for (type, id), version in self.so_cache_versions.items()],
+            "inventory": self.inventory,
+            "items": [b64encode(bytes(item)).decode() for item in self.items],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp_path, path)
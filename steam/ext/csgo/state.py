@@ -3,47 +3,85 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
-import math
-import struct
-import sys
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 from weakref import WeakValueDictionary
 
 from ... import utils
-from ..._const import READ_U32
+from ..._const import timeout
 from ..._gc import GCState as GCState_
+from ..._gc.scheduler import SendPriority
 from ...app import CSGO
 from ...id import _ID64_TO_ID32
 from ...protobufs import friends
 from ...state import parser
 from ...types.id import ID32, AssetID
-from .backpack import Backpack, Casket, CasketItem, Paint, Sticker
-from .enums import ItemFlags, ItemOrigin, ItemQuality
+from .attributes import DecodedItem, copy_fields, decode_attributes, decode_item, decode_items, merge_attributes
+from .backpack import Backpack, BackpackItem, Casket, CasketItem
+from .casket_store import CasketItemStore
+from .inspect_cache import InspectCache
 from .models import User
-from .protobufs import base, cstrike, sdk
+from .protobufs import base, cstrike, econ, sdk
+from .snapshot import BackpackSnapshot
 
 if TYPE_CHECKING:
-    from .client import Client
+    from ...enums import Language
+    from ...types.trade import DescriptionDict, InventoryDict
+    from .cache import ProfileCache
+    from .client import Client, ClientUser
+    from .inspect_store import InspectStore
 
 log = logging.getLogger(__name__)
 
 
-def READ_F32(bytes: bytes, *, _unpacker: Callable[[bytes], tuple[float]] = struct.Struct("<f").unpack_from) -> float:
-    (f32,) = _unpacker(bytes)
-    return f32
-
-
 class GCState(GCState_):
     client: Client
     _users: WeakValueDictionary[ID32, User]  # type: ignore
     _APP = CSGO  # type: ignore
+    _CREATED_ITEMS_FETCH_DELAY: ClassVar = 0.5  # how long to wait for other SOCreates before fetching their items
+    _GC_SEND_PRIORITIES: ClassVar = {
+        sdk.SOCacheSubscriptionRefresh: SendPriority.High,
+        econ.CasketItemAdd: SendPriority.High,
+        econ.CasketItemExtract: SendPriority.High,
+        econ.CasketItemLoadContents: SendPriority.High,
+        cstrike.Client2GcEconPreviewDataBlockRequest: SendPriority.Low,
+    }
+    _GC_SEND_RATES: ClassVar = {
+        cstrike.Client2GcEconPreviewDataBlockRequest: (1.0, 1),
+        cstrike.ClientRequestPlayersProfile: (1.0, 5),
+        cstrike.MatchListRequestRecentUserGames: (1.0, 5),
+        cstrike.MatchListRequestFullGameInfo: (1.0, 5),
+    }
 
     def __init__(self, client: Client, **kwargs: Any):
+        self.backpack_snapshot_path: str | os.PathLike[str] | None = kwargs.pop("backpack_snapshot_path", None)
+        inspect_cache: InspectCache | None = kwargs.pop("inspect_cache", None)
+        self.inspect_cache = inspect_cache if inspect_cache is not None else InspectCache()
+        self.inspect_store: InspectStore | None = kwargs.pop("inspect_store", None)
+        self.profile_cache: ProfileCache | None = kwargs.pop("profile_cache", None)
+        self.description_cache: dict[tuple[Language | None, str, str], DescriptionDict] | None = kwargs.pop(
+            "description_cache", None
+        )
+        self.cache_decode_executor: Executor | None = kwargs.pop("cache_decode_executor", None)
+        self.cache_decode_threshold: int = kwargs.pop("cache_decode_threshold", 500)
         super().__init__(client, **kwargs)
-        self.casket_items: dict[AssetID, CasketItem] = {}
+        self.backpack: Backpack = None  # type: ignore
+        self.casket_items = CasketItemStore(self)
         self.waiting_for_casket_items: dict[AssetID, asyncio.Future[CasketItem]] = {}
+        self.casket_notifications: dict[AssetID, asyncio.Queue[econ.ItemCustomizationNotification]] = {}
+        self.waiting_for_created_items: dict[AssetID, asyncio.Future[BackpackItem[ClientUser] | None]] = {}
+        self._created_items_fetcher: asyncio.Task[None] | None = None
+        self.so_cache_versions: dict[tuple[int, int], int] = {}  # (owner type, owner id) -> version
+        self._backpack_snapshot = (
+            BackpackSnapshot.load(self.backpack_snapshot_path) if self.backpack_snapshot_path is not None else None
+        )
+        if self._backpack_snapshot is not None:  # let the GC know what we already have
+            self.so_cache_versions |= self._backpack_snapshot.so_cache_versions
 
     def _store_user(self, proto: friends.CMsgClientPersonaStateFriend) -> User:
         try:
@@ -55,15 +93,34 @@ class GCState(GCState_):
             user._update(proto)
         return user
 
+    def add_item_to_backpack(self, item: BackpackItem[ClientUser]) -> None:  # type: ignore
+        self.backpack._add_item(item)
+        if (future := self.items_waiting.pop((item.app.id, item.id), None)) and not future.done():
+            future.set_result(item)
+
     def _get_gc_message(self) -> sdk.ClientHello:
-        return sdk.ClientHello()
+        return sdk.ClientHello(  # only ask for the caches that changed since we last saw them
+            socache_have_versions=[
+                sdk.CacheHaveVersion(soid=sdk.IDOwner(type=type, id=id), version=version)
+                for (type, id), version in self.so_cache_versions.items()
+            ]
+        )
+
+    def _set_so_cache_version(self, owner_soid: sdk.IDOwner, version: int) -> None:
+        if version:
+            self.so_cache_versions[owner_soid.type, owner_soid.id] = version
 
     async def wait_for_casket_item(self, asset_id: AssetID) -> CasketItem:
         try:
             return self.casket_items[asset_id]
         except KeyError:
             self.waiting_for_casket_items[asset_id] = future = asyncio.Future()
-            return await future
+            try:
+                async with timeout(self.gc_request_timeout):
+                    return await future
+            finally:
+                if self.waiting_for_casket_items.get(asset_id) is future:
+                    del self.waiting_for_casket_items[asset_id]
 
     @parser
     def parse_client_goodbye(self, msg: sdk.ConnectionStatus | None = None) -> None:
@@ -74,109 +131,175 @@ class GCState(GCState_):
 
     @parser
     async def parse_gc_client_connect(self, msg: sdk.ClientWelcome) -> None:
-        if msg.outofdate_subscribed_caches:
-            for cache in msg.outofdate_subscribed_caches[0].objects:
-                if cache.type_id == 1:
-                    await self.update_backpack(*(base.Item().parse(item_data) for item_data in cache.object_data))
-                else:
-                    log.debug("Unknown item %r updated", cache)
+        if self._backpack_snapshot is not None:
+            snapshot, self._backpack_snapshot = self._backpack_snapshot, None
+            await self._restore_backpack_snapshot(snapshot)
+        for cache in msg.outofdate_subscribed_caches:
+            await self.handle_cache_subscribed(cache)
+        for cache in msg.uptodate_subscribed_caches:
+            self._set_so_cache_version(cache.owner_soid, cache.version)
         if not self._gc_ready.is_set():
             self._gc_ready.set()
             self.dispatch("gc_ready")
+        await self.save_backpack_snapshot()
 
-    def set(self, name: str, value: Any) -> None:
-        # would be nice if this was a macro
-        locals = sys._getframe(1).f_locals
-        if locals["is_casket_item"]:
-            setattr(locals["gc_item"], name, value)
-        else:
-            setattr(locals["item"], name, value)
+    @parser
+    async def handle_cache_subscribed(self, msg: sdk.SOCacheSubscribed | sdk.CacheSubscribed) -> None:
+        for cache in msg.objects:
+            if cache.type_id == 1:
+                decoded = await self._decode_items(cache.object_data)
+                if self.backpack is not None:
+                    await self._reconcile_backpack(decoded)
+                await self.update_backpack(*decoded)
+            else:
+                log.debug("Unknown item %r updated", cache)
+        self._set_so_cache_version(msg.owner_soid, msg.version)
+
+    async def _decode_items(self, object_data: Sequence[bytes]) -> list[DecodedItem]:
+        # big caches are decoded in the executor so the loop is only blocked for the merge
+        executor = self.cache_decode_executor
+        if executor is None or len(object_data) < self.cache_decode_threshold:
+            return decode_items(object_data)
+        return await asyncio.get_running_loop().run_in_executor(executor, decode_items, object_data)
+
+    async def _reconcile_backpack(self, decoded: list[DecodedItem]) -> None:
+        # a subscribed cache contains every item, so anything we have that isn't in it has gone and anything we don't
+        # have that isn't in a casket needs fetching
+        ids = {gc_item.id for gc_item, _, _ in decoded}
+        for item in [item for item in self.backpack if item.id not in ids]:
+            self.backpack._remove_item(item)
+        for asset_id in [asset_id for asset_id in self.casket_items if asset_id not in ids]:
+            self.casket_items._remove(asset_id)
+
+        missing = [
+            gc_item.id
+            for gc_item, attributes, _ in decoded
+            if self.backpack.get_item(gc_item.id) is None and attributes.casket_id is None
+        ]
+        for item in await asyncio.gather(*map(self.fetch_created_item, missing)):
+            if item is not None:
+                self.add_item_to_backpack(item)
+
+    async def _restore_backpack_snapshot(self, snapshot: BackpackSnapshot) -> None:
+        await self.client.wait_until_ready()
+        if snapshot.owner_id64 != self.user.id64:
+            log.info("Ignoring backpack snapshot for %s", snapshot.owner_id64)
+            for key in snapshot.so_cache_versions:
+                self.so_cache_versions.pop(key, None)
+            return
 
-    async def update_backpack(self, *gc_items: base.Item, is_cache_subscribe: bool = False) -> Backpack:
+        self.backpack = Backpack(
+            state=self, data=snapshot.inventory, owner=self.user, app=self.client._APP, language=self.language
+        )
+        await self.update_backpack(*snapshot.items)
+        log.debug("Restored backpack from snapshot with %d items", len(snapshot.items))
+
+    async def save_backpack_snapshot(self) -> None:
+        """Write the backpack to ``backpack_snapshot_path`` so the next session can start from it."""
+        if self.backpack_snapshot_path is None or self.backpack is None:
+            return
+
+        items: list[base.Item] = []
+        for item in self.backpack:
+            try:
+                items.append(base.Item(**{name: getattr(item, name) for name in base.Item.__annotations__}))
+            except AttributeError:  # never merged with the GC's item
+                continue
+        items += (base.Item().parse(data) for data in self.casket_items._data)
+
+        data = self.backpack._data
+        asset_ids = {str(item.id) for item in items}
+        assets = [asset for asset in data.get("assets", []) if asset["assetid"] in asset_ids]
+        class_ids = {(asset["classid"], asset["instanceid"]) for asset in assets}
+        inventory = cast(
+            "InventoryDict",
+            data
+            | {
+                "assets": assets,
+                "descriptions": [
+                    description
+                    for description in data.get("descriptions", [])
+                    if (description["classid"], description["instanceid"]) in class_ids
+                ],
+                "total_inventory_count": len(assets),
+            },
+        )
+        snapshot = BackpackSnapshot(
+            owner_id64=self.user.id64,
+            so_cache_versions=dict(self.so_cache_versions),
+            inventory=inventory,
+            items=items,
+        )
+        await asyncio.to_thread(snapshot.dump, self.backpack_snapshot_path)
+
+    @parser
+    async def handle_cache_subscription_check(self, msg: sdk.SOCacheSubscriptionCheck) -> None:
+        if self.so_cache_versions.get((msg.owner_soid.type, msg.owner_soid.id)) != msg.version:
+            await self.send_gc_message(sdk.SOCacheSubscriptionRefresh(owner_soid=msg.owner_soid))
+
+    async def update_backpack(self, *gc_items: base.Item | DecodedItem, is_cache_subscribe: bool = False) -> Backpack:
         await self.client.wait_until_ready()
 
-        backpack = self.backpack or await self.fetch_backpack(Backpack)
+        backpack = self.backpack = self.backpack or await self.fetch_backpack(Backpack)
+
+        decoded = [
+            gc_item if isinstance(gc_item, DecodedItem) else DecodedItem(gc_item, decode_attributes(gc_item.attribute))
+            for gc_item in gc_items
+        ]
+        # fetch every item that's been taken out of a casket at once, so the merge below doesn't yield to the loop
+        removed_from_caskets = [
+            AssetID(gc_item.id)
+            for gc_item, attributes, _ in decoded
+            if attributes.casket_id is None
+            and backpack.get_item(gc_item.id) is None
+            and gc_item.id in self.casket_items
+        ]
+        for asset_id in removed_from_caskets:
+            self.casket_items._remove(asset_id)
+        fetched = dict(
+            zip(removed_from_caskets, await asyncio.gather(*map(self.fetch_created_item, removed_from_caskets)))
+        )
 
-        gc_item: base.Item | CasketItem
-        for gc_item in gc_items:  # merge the two items
-            item = utils.get(backpack, id=gc_item.id)
-            is_casket_item = False
+        for gc_item, attributes, data in decoded:  # merge the two items
+            item = backpack.get_item(gc_item.id)
+            if (casket_id := attributes.casket_id) is not None:  # the item is contained in a casket
+                if item is not None:  # it's just been put in it
+                    backpack._remove_item(item)
+                self.casket_items._add(gc_item, casket_id, attributes, data)
+                if future := self.waiting_for_casket_items.pop(AssetID(gc_item.id), None):
+                    future.set_result(self.casket_items[AssetID(gc_item.id)])
+                continue
+
+            removed_from_casket = item is None and gc_item.id in fetched
+            if removed_from_casket:
+                item = fetched[AssetID(gc_item.id)]
             if item is None:
-                # is the item contained in a casket?
-                casket_id_low = utils.get(gc_item.attribute, def_index=272)
-                casket_id_high = utils.get(gc_item.attribute, def_index=273)
-                if not (casket_id_low and casket_id_high):
-                    log.info("Received an item that isn't our inventory %r", gc_item)
-                    continue  # the item has been removed (gc sometimes sends you items that you have deleted)
-                is_casket_item = True  # noqa: F841  # used in macro
-                gc_item = utils.update_class(gc_item, CasketItem())
-                gc_item._casket_id = AssetID(
-                    int(
-                        f"{READ_U32(casket_id_high.value_bytes):032b}{READ_U32(casket_id_low.value_bytes):032b}",
-                        base=2,
-                    )
-                )
-            else:
-                for attribute_name in gc_item.__annotations__:
-                    setattr(item, attribute_name, getattr(gc_item, attribute_name))
+                log.info("Received an item that isn't our inventory %r", gc_item)
+                continue  # the item has been removed (gc sometimes sends you items that you have deleted)
 
+            copy_fields(item, gc_item)
             is_new = is_cache_subscribe and (gc_item.inventory >> 30) & 1
-            self.set("position", 0 if is_new else gc_item.inventory & 0xFFFF)
-
-            if custom_name := utils.get(gc_item.attribute, def_index=111):
-                self.set("custom_name", custom_name.value_bytes[2:].decode("utf-8"))
-
-            paint_index = utils.get(gc_item.attribute, def_index=6)
-            paint_seed = utils.get(gc_item.attribute, def_index=7)
-            paint_wear = utils.get(gc_item.attribute, def_index=8)
-            if any((paint_index, paint_seed, paint_wear)):
-                self.set(
-                    "paint",
-                    Paint(
-                        index=READ_F32(paint_index.value_bytes) if paint_index else 0,
-                        seed=math.floor(READ_F32(paint_seed.value_bytes)) if paint_seed else 0,
-                        wear=READ_F32(paint_wear.value_bytes) if paint_wear else 0,
-                    ),
-                )
-
-            if tradable_after_date := utils.get(gc_item.attribute, def_index=75):
-                self.set("tradable_after", utils.DateTime.from_timestamp(READ_U32(tradable_after_date.value_bytes)))
-
-            stickers: list[Sticker] = []
-            self.set("stickers", stickers)
-            for i in range(4, 24, 4):
-                if sticker_id := utils.get(gc_item.attribute, def_index=113 + i):
-                    sticker = Sticker(slot=i, id=READ_U32(sticker_id.value_bytes))  # type: ignore
-
-                    for idx, attr in enumerate(Sticker._decodeable_attrs):
-                        if attribute := utils.get(gc_item.attribute, def_index=114 + i + idx):
-                            setattr(sticker, attr, READ_F32(attribute.value_bytes))
-
-                    stickers.append(sticker)
-
-            self.set("quality", ItemQuality.try_value(gc_item.quality))
-            self.set("flags", ItemFlags.try_value(gc_item.flags))
-            self.set("origin", ItemOrigin.try_value(gc_item.origin))
+            merge_attributes(item, gc_item, attributes, is_new=bool(is_new))
 
             if gc_item.def_index == 1201:  # storage unit
-                assert item is not None
-                orig_idx = backpack.items.index(item)
-                item = utils.update_class(item, Casket.__new__(Casket))  # __class__ assignment doesn't work here
-                assert isinstance(item, Casket)
-                backpack.items[orig_idx] = item  # type: ignore  # typed as a Sequence not a list
-                item_count = utils.get(gc_item.attribute, def_index=270)
-                self.set("contained_item_count", READ_U32(item_count.value_bytes) if item_count is not None else 0)
-
-            elif not isinstance(gc_item, CasketItem) and gc_item.id in self.casket_items:
-                del self.casket_items[gc_item.id]
-                del self.waiting_for_casket_items[gc_item.id]
-
-            elif isinstance(gc_item, CasketItem):
-                self.casket_items[gc_item.id].set_result(gc_item)
-
-        self.backpack = backpack
+                if not isinstance(item, Casket):
+                    casket = utils.update_class(item, Casket.__new__(Casket))  # __class__ assignment doesn't work here
+                    backpack._replace_item(item, casket)
+                    item = casket
+                item.contained_item_count = attributes.contained_item_count or 0
+
+            if removed_from_casket:
+                self.add_item_to_backpack(item)
+
         return backpack
 
+    @parser
+    def handle_item_customization_notification(self, msg: econ.ItemCustomizationNotification) -> None:
+        for item_id in msg.item_id:  # either the casket's or the item's ID that's being added or removed
+            if (notifications := self.casket_notifications.get(AssetID(item_id))) is not None:
+                notifications.put_nowait(msg)
+                break
+
     @parser
     def handle_matchmaking_client_hello(self, msg: cstrike.MatchmakingClientHello):
         self.client.user._profile_info_msg = msg
@@ -186,67 +309,150 @@ class GCState(GCState_):
         self.dispatch("match_list", msg.matches, msg)
 
     async def fetch_user_csgo_profile(self, user_id: int) -> cstrike.PlayersProfile:
-        await self.ws.send_gc_message(cstrike.ClientRequestPlayersProfile(account_id=user_id, request_level=32))
-        return await self.gc_wait_for(
+        if self.profile_cache is not None:
+            return await self.profile_cache.fetch(user_id, lambda: self._fetch_user_csgo_profile(user_id))
+        return await self._fetch_user_csgo_profile(user_id)
+
+    async def _fetch_user_csgo_profile(self, user_id: int) -> cstrike.PlayersProfile:
+        return await self.gc_request(
+            cstrike.ClientRequestPlayersProfile(account_id=user_id, request_level=32),
             cstrike.PlayersProfile,
-            check=lambda msg: msg.account_profiles[0].account_id == user_id,
+            check=lambda msg: bool(msg.account_profiles) and msg.account_profiles[0].account_id == user_id,
         )
 
     @parser
     async def handle_so_create(self, msg: sdk.SOCreate):
+        await self._handle_so_create(msg)
+        self._set_so_cache_version(msg.owner_soid, msg.version)
+
+    async def _handle_so_create(self, msg: sdk.SOCreate) -> None:
         if msg.type_id != 1:
             return  # Not an item
 
-        cso_item = base.Item().parse(msg.object_data)
-        await self.backpack.update()
-        item = utils.get(self.backpack, id=cso_item.id)
-
-        if item is None and not (
-            utils.get(cso_item.attribute, def_index=272) and utils.get(cso_item.attribute, def_index=273)
-        ):  # it's also not a casket item
-            return log.info("Received an item that isn't our inventory %r", cso_item)
+        decoded = decode_item(msg.object_data)
+        cso_item = decoded.item
+        item = self.backpack.get_item(cso_item.id)
+        if item is None:
+            if decoded.attributes.casket_id is not None:
+                await self.update_backpack(decoded)
+                return log.debug("Received a casket item %r", cso_item)
 
-        if item is not None:
-            self.add_item_to_backpack(item)
-        await self.update_backpack(cso_item)
-        if isinstance(cso_item, CasketItem):
-            return log.debug("Received a casket item %r", cso_item)
+            item = await self.fetch_created_item(cso_item.id)
+            if item is None:
+                return log.info("Received an item that isn't our inventory %r", cso_item)
 
+        self.add_item_to_backpack(item)
+        await self.update_backpack(decoded)
         self.dispatch("item_receive", item)
 
+    async def fetch_created_item(self, asset_id: AssetID) -> BackpackItem[ClientUser] | None:
+        """Fetch the web inventory entry for an item the GC just created.
+
+        Items created within ``_CREATED_ITEMS_FETCH_DELAY`` seconds of each other share one inventory fetch and only the
+        requested items are taken from it, so the rest of the backpack is left untouched.
+        """
+        try:
+            future = self.waiting_for_created_items[asset_id]
+        except KeyError:
+            future = self.waiting_for_created_items[asset_id] = asyncio.get_running_loop().create_future()
+        if self._created_items_fetcher is None:
+            waiting = self.waiting_for_created_items
+            self._created_items_fetcher = self._tg.create_task(
+                self._fetch_created_items(waiting), name=f"steam.py GC {self._APP.id}: _fetch_created_items"
+            )
+            self._created_items_fetcher.add_done_callback(partial(self._created_items_fetched, waiting))
+        return await asyncio.shield(future)  # other SOCreates may be waiting on this item too
+
+    async def _fetch_created_items(
+        self, waiting: dict[AssetID, asyncio.Future[BackpackItem[ClientUser] | None]]
+    ) -> None:
+        await asyncio.sleep(self._CREATED_ITEMS_FETCH_DELAY)
+        self.waiting_for_created_items = {}
+        self._created_items_fetcher = None  # anything created from now on needs a new fetch
+
+        try:
+            backpack = await self.fetch_backpack(Backpack)
+        except Exception as exc:
+            for future in waiting.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if self.backpack is not None:
+            self.backpack._data = backpack._data  # this is a newer view of the inventory
+        for asset_id, future in waiting.items():
+            if not future.done():
+                future.set_result(backpack.get_item(asset_id))
+
+    def _created_items_fetched(
+        self, waiting: dict[AssetID, asyncio.Future[BackpackItem[ClientUser] | None]], task: asyncio.Task[None]
+    ) -> None:
+        # the fetch can be cancelled, e.g. by the client closing, before it's even started so nothing can be left
+        # waiting for it
+        if self.waiting_for_created_items is waiting:
+            self.waiting_for_created_items = {}
+            self._created_items_fetcher = None
+        for future in waiting.values():
+            if not future.done():
+                future.cancel()
+
     @parser
     async def handle_so_update(self, msg: sdk.SOUpdate):
         await self._handle_so_update(msg)
+        self._set_so_cache_version(msg.owner_soid, msg.version)
 
     @parser
     async def handle_so_update_multiple(self, msg: sdk.MultipleObjects):
-        for object in msg.objects_modified:
-            await self._handle_so_update(object)
+        await self._handle_so_update(*msg.objects_modified)
+        self._set_so_cache_version(msg.owner_soid, msg.version)
 
     async def _handle_so_update(
-        self, object: sdk.SOCreate | sdk.SODestroy | sdk.SOUpdate | sdk.MultipleObjectsSingleObject
+        self, *objects: sdk.SOCreate | sdk.SODestroy | sdk.SOUpdate | sdk.MultipleObjectsSingleObject
     ) -> None:
-        if object.type_id != 1:
-            return log.debug("Unknown item %r updated", object)
-
-        cso_item = base.Item().parse(object.object_data)
+        cso_items: list[DecodedItem] = []
+        befores: list[BackpackItem[ClientUser] | None] = []
+        for object in objects:
+            if object.type_id != 1:
+                log.debug("Unknown item %r updated", object)
+                continue
+
+            decoded = decode_item(object.object_data)
+            cso_item = decoded.item
+            before = self.backpack.get_item(cso_item.id)
+            if before is None and cso_item.id not in self.casket_items and decoded.attributes.casket_id is None:
+                log.info("Received an item that isn't our inventory %r", cso_item)
+                continue
+            cso_items.append(decoded)
+            befores.append(None if before is None else copy.copy(before))  # the merge below updates it in place
+
+        if not cso_items:
+            return
 
-        before = utils.get(self.backpack, id=cso_item.id)
-        if before is None:
-            return log.info("Received an item that isn't our inventory %r", cso_item)
-        after = utils.get(await self.update_backpack(cso_item), id=cso_item.id)
-        self.dispatch("item_update", before, after)
+        backpack = await self.update_backpack(*cso_items)  # merge the whole batch at once
+        updated = [
+            (before, after)
+            for before, (cso_item, _, _) in zip(befores, cso_items)
+            if before is not None and (after := backpack.get_item(cso_item.id)) is not None
+        ]  # items moved in to or out of caskets don't count as updates
+        for before, after in updated:
+            self.dispatch("item_update", before, after)
+        if updated:
+            self.dispatch("item_update_many", updated)
 
     @parser
     def handle_so_destroy(self, msg: sdk.SODestroy):
+        self._handle_so_destroy(msg)
+        self._set_so_cache_version(msg.owner_soid, msg.version)
+
+    def _handle_so_destroy(self, msg: sdk.SODestroy) -> None:
         if msg.type_id != 1 or not self.backpack:
             return
 
         deleted_item = base.Item().parse(msg.object_data)
-        item = utils.get(self.backpack, id=deleted_item.id)
+        item = self.backpack.get_item(deleted_item.id)
         if item is None:
             return log.info("Received an item that isn't our inventory %r", deleted_item)
         for attribute_name in deleted_item.__annotations__:
             setattr(item, attribute_name, getattr(deleted_item, attribute_name))
-        self.backpack.items.remove(item)  # type: ignore
+        self.backpack._remove_item(item)
         self.dispatch("item_remove", item)
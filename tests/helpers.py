@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from steam.app import CSGO
+from steam.ext.csgo.backpack import Backpack, BackpackItem
+from steam.ext.csgo.casket_store import CasketItemStore
+from steam.ext.csgo.state import GCState
+from steam.types.id import AssetID, ContextID
+
+OWNER_ID64 = 76561198000000000
+
+
+def make_item(id: int, cls: type[BackpackItem[Any]] = BackpackItem) -> Any:
+    item = cls.__new__(cls)
+    item.id = AssetID(id)
+    item._app_id = CSGO.id
+    item.context_id = ContextID(2)
+    return item
+
+
+def make_backpack(state: Any, *items: Any) -> Backpack:
+    backpack = Backpack.__new__(Backpack)
+    backpack._state = state
+    backpack.app = CSGO
+    backpack.items = []  # type: ignore
+    backpack._indices = {}
+    backpack._data = {"assets": [], "descriptions": [], "total_inventory_count": 0}  # type: ignore
+    for item in items:
+        backpack._add_item(item)
+    return backpack
+
+
+async def _ready() -> None:
+    pass
+
+
+def make_state(**attrs: Any) -> Any:
+    """A csgo GCState that isn't connected to anything, sent GC messages and dispatched events are recorded."""
+    state: Any = GCState.__new__(GCState)
+    state.client = SimpleNamespace(
+        _APP=CSGO,
+        _GC_APPS={CSGO.id: CSGO},
+        _tg=SimpleNamespace(create_task=asyncio.create_task),
+        wait_until_ready=_ready,
+    )
+    state.user = SimpleNamespace(id64=OWNER_ID64)
+    state.http = SimpleNamespace(language=None)
+    state.dispatched = []
+    state.dispatch = lambda event, *args: state.dispatched.append((event, *args))
+    state.sent = []
+
+    async def send_gc_message(msg: Any, **_: Any) -> None:
+        state.sent.append(msg)
+
+    state.send_gc_message = send_gc_message
+    state.items_waiting = {}
+    state.gc_listeners = {}
+    state.gc_request_timeout = 1.0
+    state.backpack_snapshot_path = None
+    state.description_cache = None
+    state.cache_decode_executor = None
+    state.cache_decode_threshold = 500
+    state.casket_items = CasketItemStore(state)
+    state.waiting_for_casket_items = {}
+    state.casket_notifications = {}
+    state.waiting_for_created_items = {}
+    state._created_items_fetcher = None
+    state.so_cache_versions = {}
+    state._backpack_snapshot = None
+    state.backpack = make_backpack(state)
+    for name, value in attrs.items():
+        setattr(state, name, value)
+    return state
@@ -0,0 +1,182 @@
+import asyncio
+from typing import Any, ClassVar
+
+import pytest
+from helpers import make_backpack, make_item, make_state
+
+from steam.enums import Language
+from steam.ext.csgo.backpack import Backpack, Casket
+from steam.ext.csgo.protobufs import base
+from steam.trade import Inventory
+
+
+def _update(self: Any, data: Any) -> None:  # what steam.py does with an inventory's descriptions
+    for asset in data["assets"]:
+        for description in data["descriptions"]:
+            if (description["classid"], description["instanceid"]) == (asset["classid"], asset["instanceid"]):
+                description.update(asset)
+    self.items = []
+
+
+def make_data(asset_id: str, name: str) -> Any:
+    return {
+        "assets": [{"assetid": asset_id, "classid": "1", "instanceid": "2"}],
+        "descriptions": [{"classid": "1", "instanceid": "2", "name": name}],
+        "total_inventory_count": 1,
+    }
+
+
+def test_shared_descriptions_are_not_merged_into(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Inventory, "_update", _update)
+    description_cache: dict[Any, Any] = {}
+    first = make_backpack(make_state(description_cache=description_cache))
+    second = make_backpack(make_state(description_cache=description_cache))
+    first._language = second._language = None
+
+    Backpack._update(first, make_data("10", "AK-47"))
+    Backpack._update(second, make_data("20", "AK-47"))
+
+    [cached] = description_cache.values()
+    assert "assetid" not in cached
+    assert first._data["descriptions"][0]["assetid"] == "10"
+    assert second._data["descriptions"][0]["assetid"] == "20"
+
+
+def test_descriptions_are_cached_per_language(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Inventory, "_update", _update)
+    description_cache: dict[Any, Any] = {}
+    english = make_backpack(make_state(description_cache=description_cache))
+    german = make_backpack(make_state(description_cache=description_cache))
+    english._language = Language.English
+    german._language = Language.German
+
+    Backpack._update(english, make_data("10", "AK-47"))
+    Backpack._update(german, make_data("20", "AK-47 (Deutsch)"))
+
+    assert german._data["descriptions"][0]["name"] == "AK-47 (Deutsch)"
+    assert len(description_cache) == 2
+
+
+class SlowCasket(Casket):
+    __slots__ = ()
+    loading: ClassVar[int] = 0
+    most_loading: ClassVar[int] = 0
+    cancelled: ClassVar[int] = 0
+
+    async def contents(self) -> Any:
+        cls = SlowCasket
+        cls.loading += 1
+        cls.most_loading = max(cls.most_loading, cls.loading)
+        try:
+            await asyncio.sleep(0.01 * self.id)
+        except asyncio.CancelledError:
+            cls.cancelled += 1
+            raise
+        finally:
+            cls.loading -= 1
+        return [self.id * 10]
+
+
+@pytest.fixture
+def caskets() -> Any:
+    SlowCasket.loading = SlowCasket.most_loading = SlowCasket.cancelled = 0
+    return make_backpack(make_state(), make_item(100), *(make_item(id, SlowCasket) for id in range(1, 6)))
+
+
+def test_load_all_casket_contents(caskets: Backpack) -> None:
+    contents = asyncio.run(caskets.load_all_casket_contents(concurrency=2))
+
+    assert contents == {id: [id * 10] for id in range(1, 6)}
+    assert SlowCasket.most_loading == 2
+
+
+def test_casket_contents_yields_as_each_casket_loads(caskets: Backpack) -> None:
+    async def main() -> list[int]:
+        return [casket.id async for casket, _ in caskets.casket_contents(concurrency=5)]
+
+    assert asyncio.run(main()) == [1, 2, 3, 4, 5]
+
+
+def test_casket_contents_stops_loading_when_closed(caskets: Backpack) -> None:
+    async def main() -> None:
+        contents = caskets.casket_contents(concurrency=5)
+        casket, _ = await anext(contents)
+        assert casket.id == 1
+        await contents.aclose()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert SlowCasket.cancelled == 4
+    assert SlowCasket.loading == 0
+
+
+def test_casket_contents_needs_a_concurrency(caskets: Backpack) -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(caskets.load_all_casket_contents(concurrency=0))
+
+
+def assert_in_sync(backpack: Backpack) -> None:
+    assert backpack._indices == {item.id: idx for idx, item in enumerate(backpack.items)}
+    assert all(backpack.get_item(item.id) is item for item in backpack.items)
+
+
+def ids(backpack: Backpack) -> set[int]:
+    return {item.id for item in backpack.items}
+
+
+def test_indices_follow_adds_and_removes() -> None:
+    items = [make_item(id) for id in range(1, 7)]
+    backpack = make_backpack(make_state(), *items)
+
+    for item in (items[1], items[5], items[0]):  # the middle, the end and the start
+        backpack._remove_item(item)
+        assert_in_sync(backpack)
+        assert backpack.get_item(item.id) is None
+    assert ids(backpack) == {3, 4, 5}
+
+    replacement = make_item(4)
+    backpack._add_item(replacement)
+    backpack._add_item(make_item(7))
+    assert_in_sync(backpack)
+    assert backpack.get_item(4) is replacement
+    assert ids(backpack) == {3, 4, 5, 7}
+
+    for item in list(backpack.items):
+        backpack._remove_item(item)
+    assert backpack.items == [] and backpack._indices == {}
+
+
+def test_indices_follow_caskets_being_converted_and_filled() -> None:
+    state = make_state()
+    for id in range(1, 6):
+        state.backpack._add_item(make_item(id))
+    casket = base.Item(id=2, def_index=1201, attribute=[base.ItemAttribute(def_index=270, value_bytes=b"\x01\0\0\0")])
+    stored = base.Item(
+        id=4,
+        def_index=7,
+        attribute=[
+            base.ItemAttribute(def_index=272, value_bytes=b"\x02\0\0\0"),
+            base.ItemAttribute(def_index=273, value_bytes=b"\0\0\0\0"),
+        ],
+    )
+
+    backpack = asyncio.run(state.update_backpack(base.Item(id=1, def_index=7), casket, stored))
+
+    assert_in_sync(backpack)
+    assert ids(backpack) == {1, 2, 3, 5}
+    assert isinstance(backpack.get_item(2), Casket)
+    assert 4 in state.casket_items
+
+
+def test_indices_are_rebuilt_when_refetched(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _update(self: Any, data: Any) -> None:
+        self.items = [make_item(int(asset["assetid"])) for asset in data["assets"]]
+
+    monkeypatch.setattr(Inventory, "_update", _update)
+    backpack = make_backpack(make_state(), make_item(1), make_item(2))
+
+    Backpack._update(backpack, {"assets": [{"assetid": "3"}, {"assetid": "2"}], "descriptions": []})  # type: ignore
+
+    assert_in_sync(backpack)
+    assert ids(backpack) == {2, 3}
+    assert backpack.get_item(1) is None
@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from helpers import make_item, make_state
+
+from steam.ext.csgo import use_fast_decoders
+from steam.ext.csgo.protobufs import base, sdk
+
+OWNER = sdk.IDOwner(type=1, id=76561198000000000)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(1)
+        self.submitted = 0
+
+    def submit(self, *args: Any, **kwargs: Any) -> Any:
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def make_cache(*ids: int) -> sdk.SOCacheSubscribed:
+    object_data = [bytes(base.Item(id=id, def_index=7, inventory=id, quality=4)) for id in ids]
+    return sdk.SOCacheSubscribed(
+        objects=[sdk.CacheSubscribedSubscribedType(type_id=1, object_data=object_data)], owner_soid=OWNER, version=5
+    )
+
+
+def subscribe(executor: Executor | None, threshold: int = 1) -> Any:
+    ids = (1, 2, 3)
+    state = make_state(cache_decode_executor=executor, cache_decode_threshold=threshold)
+    for id in ids:
+        state.backpack._add_item(make_item(id))
+
+    asyncio.run(state.handle_cache_subscribed(make_cache(*ids)))
+    return state
+
+
+def assert_merged(state: Any) -> None:
+    assert [(item.id, item.def_index, item.position) for item in state.backpack] == [(1, 7, 1), (2, 7, 2), (3, 7, 3)]
+    assert state.so_cache_versions == {(1, 76561198000000000): 5}
+
+
+def test_decoded_in_the_loop_without_an_executor() -> None:
+    assert_merged(subscribe(None))
+
+
+def test_small_caches_are_decoded_in_the_loop() -> None:
+    executor = CountingExecutor()
+    with executor:
+        state = subscribe(executor, threshold=4)
+
+    assert executor.submitted == 0
+    assert_merged(state)
+
+
+def test_decoded_in_a_thread_pool() -> None:
+    executor = CountingExecutor()
+    with executor:
+        state = subscribe(executor)
+
+    assert executor.submitted == 1
+    assert_merged(state)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_decoded_in_a_process_pool(fast: bool) -> None:
+    use_fast_decoders(fast)
+    try:
+        with ProcessPoolExecutor(1) as executor:
+            state = subscribe(executor)
+    finally:
+        use_fast_decoders(False)
+
+    assert_merged(state)
+    item = state.backpack.get_item(1)
+    assert item.custom_name == "" and type(item.interior_item) is base.Item
@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from steam._gc.state import APP, GCState
+from steam.ext.csgo.backpack import Casket
+
+APP_ID = 730
+
+
+class FakeState:
+    def __init__(self, *, deliver: bool) -> None:
+        self.items_waiting: dict[tuple[int, int], asyncio.Future[Any]] = {}
+        self.gc_request_timeout = 0.05
+        self.deliver = deliver
+
+    async def gc_request(self, msg: Any, *_: Any, **__: Any) -> None:
+        if self.deliver:  # the item can be received before the notification
+            self.items_waiting.pop((APP_ID, msg.item_item_id)).set_result(SimpleNamespace(id=msg.item_item_id))
+
+
+def make_casket(state: FakeState) -> Any:
+    return SimpleNamespace(id=1, app=SimpleNamespace(id=APP_ID), _state=state, contained_item_count=1)
+
+
+def test_remove_sees_an_item_received_before_the_notification() -> None:
+    state = FakeState(deliver=True)
+    casket = make_casket(state)
+
+    item = asyncio.run(Casket.remove(casket, SimpleNamespace(id=2, _casket_id=1)))  # type: ignore
+
+    assert item.id == 2
+    assert casket.contained_item_count == 0
+    assert not state.items_waiting
+
+
+def test_remove_timing_out_stops_waiting() -> None:
+    state = FakeState(deliver=False)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(Casket.remove(make_casket(state), SimpleNamespace(id=2, _casket_id=1)))  # type: ignore
+
+    assert not state.items_waiting
+
+
+def test_wait_for_item_stops_waiting_when_cancelled() -> None:
+    state = SimpleNamespace(items_waiting={})
+
+    async def main() -> None:
+        APP.set(SimpleNamespace(id=APP_ID))  # type: ignore
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(GCState.wait_for_item(state, 2), 0.01)  # type: ignore
+
+    asyncio.run(main())
+    assert not state.items_waiting
@@ -0,0 +1,65 @@
+import struct
+from types import SimpleNamespace
+from typing import Any
+
+from steam.ext.csgo.attributes import decode_attributes, decode_items, merge_attributes
+from steam.ext.csgo.backpack import CasketItem
+from steam.ext.csgo.casket_store import CasketItemStore
+from steam.ext.csgo.protobufs import base
+from steam.types.id import AssetID
+
+
+def make_item(id: int, *, paint: bool = True) -> base.Item:
+    attributes = [base.ItemAttribute(def_index=111, value_bytes=b"\x00\x04name")]
+    if paint:
+        attributes += [
+            base.ItemAttribute(def_index=6, value_bytes=struct.pack("<f", 44)),
+            base.ItemAttribute(def_index=7, value_bytes=struct.pack("<f", 661.5)),
+            base.ItemAttribute(def_index=8, value_bytes=struct.pack("<f", 0.07)),
+        ]
+    return base.Item(id=id, def_index=7, inventory=3, quality=4, origin=8, attribute=attributes)
+
+
+def make_store(*gc_items: base.Item) -> CasketItemStore:
+    store = CasketItemStore(SimpleNamespace(backpack=None))  # type: ignore
+    for gc_item in gc_items:
+        store._add(gc_item, AssetID(100), decode_attributes(gc_item.attribute))
+    return store
+
+
+def test_columns_are_read_without_parsing() -> None:
+    store = make_store(make_item(1), make_item(2, paint=False))
+    item: Any = store[AssetID(1)]
+
+    assert (item.id, item.def_index) == (1, 7)
+    assert (item.paint.index, item.paint.seed) == (44, 661)
+    assert abs(item.paint.wear - 0.07) < 1e-6
+    assert item._data is not None
+    assert not hasattr(store[AssetID(2)], "paint")
+    assert sorted(item.id for item in store.in_casket(AssetID(100))) == [1, 2]
+
+
+def test_the_rest_is_parsed_on_first_use() -> None:
+    gc_item = make_item(1)
+    store = make_store(gc_item)
+    item: Any = store[AssetID(1)]
+
+    expected = CasketItem()
+    merge_attributes(expected, gc_item, decode_attributes(gc_item.attribute))
+
+    assert item.custom_name == "name"
+    assert item._data is None
+    for name in ("position", "custom_name", "paint", "quality", "origin", "flags", "stickers"):
+        assert getattr(item, name) == getattr(expected, name)
+    assert (item.id, item.def_index, item.quantity) == (gc_item.id, gc_item.def_index, gc_item.quantity)
+    assert isinstance(item, CasketItem)
+
+
+def test_items_are_stored_as_received() -> None:
+    data = bytes(make_item(1))
+    (decoded,) = decode_items([memoryview(data)])
+    store = CasketItemStore(SimpleNamespace(backpack=None))  # type: ignore
+    store._add(decoded.item, AssetID(100), decoded.attributes, decoded.data)
+
+    assert type(store._data[0]) is bytes and store._data[0] == data
+    assert store[AssetID(1)].custom_name == "name"
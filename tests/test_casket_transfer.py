@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from helpers import make_item, make_state
+
+from steam.ext.csgo.backpack import Casket, CasketItem
+from steam.ext.csgo.enums import ItemCustomizationNotification as Notification
+from steam.ext.csgo.protobufs import econ
+from steam.types.id import AssetID
+
+CASKET_ID = 100
+
+
+def make_casket(respond: Callable[[Any, Any], list[econ.ItemCustomizationNotification]]) -> Any:
+    """A casket whose state answers each request with the notifications from ``respond``, one loop iteration later."""
+    state = make_state()
+    casket = make_item(CASKET_ID, Casket)
+    casket._state = state
+    casket.contained_item_count = 0
+
+    async def send_gc_message(msg: Any, **_: Any) -> None:
+        state.sent.append(msg)
+        for notification in respond(state, msg):
+            asyncio.get_running_loop().call_soon(state.handle_item_customization_notification, notification)
+
+    state.send_gc_message = send_gc_message
+    return casket
+
+
+def notification(request: Notification, *item_ids: int) -> econ.ItemCustomizationNotification:
+    return econ.ItemCustomizationNotification(item_id=list(item_ids), request=request)
+
+
+def collect(transfer: Any) -> tuple[list[int], Exception | None]:
+    async def main() -> tuple[list[int], Exception | None]:
+        ids: list[int] = []
+        try:
+            async for item in transfer:
+                ids.append(item.id)
+        except Exception as exc:
+            return ids, exc
+        return ids, None
+
+    return asyncio.run(main())
+
+
+def test_add_many_matches_notifications_by_item() -> None:
+    responses: list[Any] = []
+
+    def respond(state: Any, msg: econ.CasketItemAdd) -> list[Any]:
+        responses.append(notification(Notification.CasketAdded, CASKET_ID, msg.item_item_id))
+        if len(responses) == 3:  # answer the window newest first
+            return responses[::-1]
+        return []
+
+    casket = make_casket(respond)
+    ids, exc = collect(casket.add_many([make_item(id) for id in (1, 2, 3)], window=3))
+
+    assert exc is None
+    assert ids == [3, 2, 1]
+    assert casket.contained_item_count == 3
+    assert not casket._state.casket_notifications
+
+
+def test_add_many_stops_when_the_casket_is_full() -> None:
+    def respond(state: Any, msg: econ.CasketItemAdd) -> list[Any]:
+        if msg.item_item_id == 2:  # a failure that only names the item
+            return [notification(Notification.CasketTooFull, msg.item_item_id)]
+        return [notification(Notification.CasketAdded, CASKET_ID, msg.item_item_id)]
+
+    casket = make_casket(respond)
+    ids, exc = collect(casket.add_many([make_item(id) for id in range(1, 6)], window=3))
+
+    assert isinstance(exc, ValueError)
+    assert ids == [1, 3, 4]  # 3 and 4 were sent before the failure was received
+    assert [msg.item_item_id for msg in casket._state.sent] == [1, 2, 3, 4]
+    assert casket.contained_item_count == 3
+    assert not casket._state.casket_notifications
+
+
+def test_add_many_ignores_other_requests_notifications() -> None:
+    def respond(state: Any, msg: econ.CasketItemAdd) -> list[Any]:
+        return [
+            notification(Notification.CasketAdded, CASKET_ID, 999),  # e.g. from Casket.add
+            notification(Notification.CasketAdded, CASKET_ID, msg.item_item_id),
+        ]
+
+    casket = make_casket(respond)
+    ids, exc = collect(casket.add_many([make_item(id) for id in (1, 2)]))
+
+    assert exc is None
+    assert ids == [1, 2]
+    assert casket.contained_item_count == 2
+
+
+def make_casket_item(id: int) -> Any:
+    item = CasketItem.__new__(CasketItem)
+    item.id = AssetID(id)
+    item._casket_id = CASKET_ID
+    return item
+
+
+def test_remove_many_stops_when_the_inventory_is_full() -> None:
+    def respond(state: Any, msg: econ.CasketItemExtract) -> list[Any]:
+        if msg.item_item_id == 3:
+            return [notification(Notification.CasketInvFull, msg.item_item_id)]
+        state.items_waiting.pop((730, msg.item_item_id)).set_result(make_item(msg.item_item_id))
+        return [notification(Notification.CasketRemoved, CASKET_ID, msg.item_item_id)]
+
+    casket = make_casket(respond)
+    casket.contained_item_count = 4
+    ids, exc = collect(casket.remove_many([make_casket_item(id) for id in range(1, 5)], window=1))
+
+    assert isinstance(exc, ValueError)
+    assert ids == [1, 2]
+    assert [msg.item_item_id for msg in casket._state.sent] == [1, 2, 3]
+    assert casket.contained_item_count == 2
+    assert not casket._state.casket_notifications
+    assert not casket._state.items_waiting
+
+
+def test_remove_many_needs_items_from_this_casket() -> None:
+    item = make_casket_item(1)
+    item._casket_id = CASKET_ID + 1
+
+    casket = make_casket(lambda state, msg: [])
+    _, exc = collect(casket.remove_many([item]))
+
+    assert isinstance(exc, ValueError)
+    assert not casket._state.sent
@@ -0,0 +1,45 @@
+from steam.app import CSGO
+from steam.ext import csgo
+from steam.ext.csgo.protobufs import sdk
+from steam.ext.csgo.state import GCState
+from steam.state import parser
+
+
+class MyState(GCState):
+    @parser
+    def handle_cache_subscription_refresh(self, msg: sdk.SOCacheSubscriptionRefresh) -> None:
+        pass
+
+
+class Base(csgo.Client):
+    pass
+
+
+class Sub(Base):
+    pass
+
+
+class Narrowed(csgo.Client):
+    _state: MyState
+
+
+class NarrowedSub(Narrowed):
+    pass
+
+
+def test_each_subclass_composes_its_own_state() -> None:
+    for cls in (Base, Sub):
+        assert cls._GC_BASES == (GCState,)
+        assert cls._GC_APPS == {CSGO.id: CSGO}
+        assert cls._GC_STATE is not None and cls._GC_STATE.__mro__[1] is GCState
+        assert cls._GC_STATE.gc_parsers.keys() == csgo.Client._GC_STATE.gc_parsers.keys()  # type: ignore
+    assert Sub._GC_STATE is not Base._GC_STATE
+
+
+def test_a_narrowed_state_replaces_the_state_it_subclasses() -> None:
+    for cls in (Narrowed, NarrowedSub):
+        assert cls._GC_BASES == (MyState,)
+        assert cls._GC_APPS == {CSGO.id: CSGO}
+        assert cls._GC_STATE is not None and cls._GC_STATE.__mro__[1:3] == (MyState, GCState)
+        assert sdk.SOCacheSubscriptionRefresh in cls._GC_STATE.gc_parsers
+        assert csgo.Client._GC_STATE.gc_parsers.keys() < cls._GC_STATE.gc_parsers.keys()  # type: ignore
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any
+
+import pytest
+from helpers import make_backpack, make_item, make_state
+
+
+def make_fetching_state(*ids: int, error: Exception | None = None) -> Any:
+    state = make_state(_CREATED_ITEMS_FETCH_DELAY=0.01, fetches=0)
+
+    async def fetch_backpack(cls: Any) -> Any:
+        state.fetches += 1
+        if error is not None:
+            raise error
+        return make_backpack(state, *map(make_item, ids))
+
+    state.fetch_backpack = fetch_backpack
+    return state
+
+
+def test_items_created_together_share_a_fetch() -> None:
+    state = make_fetching_state(1, 2, 3)
+
+    async def main() -> None:
+        first, second, missing = await asyncio.gather(*map(state.fetch_created_item, (1, 2, 4)))
+        assert (first.id, second.id, missing) == (1, 2, None)
+        assert state.fetches == 1
+
+        await state.fetch_created_item(3)  # created after the fetch
+        assert state.fetches == 2
+
+    asyncio.run(main())
+    assert not state.waiting_for_created_items
+    assert state._created_items_fetcher is None
+
+
+def test_a_failed_fetch_fails_every_waiter() -> None:
+    state = make_fetching_state(error=RuntimeError("inventory is private"))
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(*map(state.fetch_created_item, (1, 2)), return_exceptions=True)
+
+    assert [type(result) for result in asyncio.run(main())] == [RuntimeError, RuntimeError]
+    assert state.fetches == 1
+
+
+@pytest.mark.parametrize("started", [False, True])
+def test_cancelling_the_fetch_cancels_the_waiters(started: bool) -> None:
+    state = make_fetching_state(1)
+
+    async def main() -> None:
+        waiter = asyncio.create_task(state.fetch_created_item(1))
+        await asyncio.sleep(0)
+        if started:  # it's waiting for other items to be created
+            await asyncio.sleep(0)
+        state._created_items_fetcher.cancel()  # e.g. the client closing
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, 1)
+
+        assert not state.waiting_for_created_items
+        assert state._created_items_fetcher is None
+        item = await asyncio.wait_for(state.fetch_created_item(1), 1)  # a new fetch is started
+        assert item.id == 1
+
+    asyncio.run(main())
+    assert state.fetches == 1
@@ -0,0 +1,137 @@
+import pickle
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import betterproto
+import pytest
+
+from steam.ext.csgo import fast_decoders_enabled, use_fast_decoders
+from steam.ext.csgo.attributes import decode_items
+from steam.ext.csgo.protobufs import base, sdk
+
+
+def random_item(rng: random.Random, depth: int = 0) -> base.Item:
+    item = base.Item(
+        id=rng.getrandbits(64),
+        account_id=rng.getrandbits(32),
+        inventory=rng.getrandbits(32),
+        def_index=rng.randrange(10_000),
+        quantity=rng.randrange(2),
+        quality=rng.randrange(13),
+        flags=rng.getrandbits(8),
+        origin=rng.randrange(25),
+        custom_name=rng.choice(("", "name", "ñämé 🔥")),
+        in_use=rng.random() < 0.5,
+        rarity=rng.randrange(7),
+        attribute=[
+            base.ItemAttribute(
+                def_index=rng.choice((6, 7, 8, 111, 117, 121)), value_bytes=struct.pack("<f", rng.random())
+            )
+            for _ in range(rng.randrange(6))
+        ],
+        equipped_state=[base.ItemEquipped(new_class=rng.randrange(4), new_slot=rng.randrange(60))],
+    )
+    if depth == 0 and rng.random() < 0.2:
+        item.interior_item = random_item(rng, depth + 1)
+    return item
+
+
+def random_cache(rng: random.Random) -> bytes:
+    return bytes(
+        sdk.CacheSubscribedSubscribedType(
+            type_id=1, object_data=[bytes(random_item(rng)) for _ in range(rng.randrange(1, 5))]
+        )
+    )
+
+
+def mutate(rng: random.Random, data: bytes) -> bytes:
+    mutated = bytearray(data)
+    match rng.randrange(3):
+        case 0:
+            for _ in range(rng.randrange(1, 4)):
+                mutated[rng.randrange(len(mutated))] = rng.getrandbits(8)
+        case 1:
+            del mutated[rng.randrange(len(mutated)) :]
+        case _:
+            mutated.insert(rng.randrange(len(mutated)), rng.getrandbits(8))
+    return bytes(mutated)
+
+
+def parse(cls: type[betterproto.Message], data: Any, *, fast: bool) -> Any:
+    use_fast_decoders(fast)
+    try:
+        return cls().parse(data)
+    except Exception as exc:
+        return type(exc)
+    finally:
+        use_fast_decoders(False)
+
+
+def serialize(message: betterproto.Message) -> Any:
+    try:
+        return bytes(message)
+    except Exception as exc:  # betterproto can parse a mistyped field that it then can't serialise
+        return type(exc)
+
+
+def assert_equivalent(cls: type[betterproto.Message], data: bytes) -> None:
+    expected = parse(cls, data, fast=False)
+    for buffer in (data, memoryview(data)):
+        actual = parse(cls, buffer, fast=True)
+        if isinstance(expected, type):  # both should fail, though not necessarily with the same exception
+            assert isinstance(actual, type), f"{data!r} parsed as {actual!r}"
+        else:
+            assert actual == expected
+            assert serialize(actual) == serialize(expected)
+
+
+def test_toggle() -> None:
+    assert not fast_decoders_enabled()  # importing doesn't install them
+    assert "parse" not in base.Item.__dict__
+    use_fast_decoders()
+    assert fast_decoders_enabled()
+    use_fast_decoders(False)
+    assert not fast_decoders_enabled()
+    assert "parse" not in base.Item.__dict__
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_valid_messages_parse_the_same(seed: int) -> None:
+    rng = random.Random(seed)
+    assert_equivalent(base.Item, bytes(random_item(rng)))
+    assert_equivalent(sdk.CacheSubscribedSubscribedType, random_cache(rng))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_mutated_messages_parse_the_same(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(50):
+        assert_equivalent(base.Item, mutate(rng, bytes(random_item(rng))))
+        assert_equivalent(sdk.CacheSubscribedSubscribedType, mutate(rng, random_cache(rng)))
+
+
+POOL_ITEM = base.Item(id=1, def_index=7, attribute=[base.ItemAttribute(def_index=6, value_bytes=struct.pack("<f", 44))])
+
+
+def decode_in_pool(*, fast: bool) -> list[Any]:
+    data = bytes(POOL_ITEM)
+    use_fast_decoders(fast)
+    try:
+        with ProcessPoolExecutor(1) as executor:
+            return executor.submit(decode_items, [data]).result()
+    finally:
+        use_fast_decoders(False)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_decoded_items_survive_a_process_pool(fast: bool) -> None:
+    ((item, attributes, _),) = decode_in_pool(fast=fast)
+
+    assert item == POOL_ITEM
+    assert item.custom_name == ""
+    assert type(item.interior_item) is base.Item
+    assert item.attribute[0].value == 0
+    assert attributes.paint_index == 44
+    assert pickle.loads(pickle.dumps(item)) == item
@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from steam.ext.csgo import Fleet
+
+
+class FakeClient:
+    _GC_HEART_BEAT = 0.01
+
+    def __init__(self, *, slow: bool = False) -> None:
+        ready = asyncio.Event()
+        ready.set()
+        self._state = SimpleNamespace(login_complete=ready, _gc_ready=ready)
+        self.slow = slow
+        self.closed = False
+        self.heartbeats = 0
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def _send_gc_heartbeat(self) -> None:
+        self.heartbeats += 1
+        if self.slow:
+            await asyncio.Event().wait()
+
+
+def make_fleet(*clients: Any) -> Fleet:
+    fleet = Fleet([{} for _ in clients], client=FakeClient)  # type: ignore
+    fleet._clients = dict(enumerate(clients))
+    return fleet
+
+
+def test_a_slow_heartbeat_does_not_hold_up_the_others() -> None:
+    async def main() -> None:
+        slow, fast = FakeClient(slow=True), FakeClient()
+        heartbeat = asyncio.create_task(make_fleet(slow, fast)._heartbeat())
+        await asyncio.sleep(0.1)
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+        assert slow.heartbeats == 1  # its last heartbeat was still being sent, so it wasn't sent again
+        assert fast.heartbeats > 3
+
+    asyncio.run(main())
+
+
+def test_closed_clients_are_not_ready() -> None:
+    async def main() -> None:
+        running, closed = FakeClient(), FakeClient()
+        closed.closed = True
+        fleet = make_fleet(running, closed)
+
+        assert fleet.ready_clients == [running]
+        assert not fleet.is_ready()
+
+    asyncio.run(main())
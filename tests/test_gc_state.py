@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from steam._gc import state as gc_state
+from steam._gc.state import GCState, LazyGCMessage
+from steam.app import CSGO
+from steam.ext.csgo.protobufs import base, sdk
+from steam.protobufs import GCProtobufMessage
+from steam.protobufs.client_server_2 import CMsgGcClientFromGC
+
+
+class FakeState:
+    gc_parsers: dict[Any, Any] = {}
+    gc_parser_emsgs = frozenset[int]()
+    gc_instrumentation = None
+    parse_gc_message = GCState.parse_gc_message
+    _parse_gc_message = GCState._parse_gc_message
+    gc_wait_for = GCState.gc_wait_for
+    _remove_gc_listener = GCState._remove_gc_listener
+
+    def __init__(self) -> None:
+        self.gc_listeners: dict[Any, Any] = {}
+        self.client = SimpleNamespace(_APP=CSGO, _GC_APPS={CSGO.id: CSGO})
+
+
+def from_gc(msg: Any) -> CMsgGcClientFromGC:
+    payload = bytes(msg)
+    return CMsgGcClientFromGC(appid=CSGO.id, msgtype=int.from_bytes(payload[:4], "little"), payload=payload)
+
+
+def test_bytes_fields_are_bytes() -> None:
+    async def main() -> None:
+        state: Any = FakeState()
+        item = base.Item(id=1, attribute=[base.ItemAttribute(def_index=6, value_bytes=b"\x00\x00\x80?")])
+        future = state.gc_wait_for(sdk.MultipleObjects, app_id=CSGO.id)
+        await state.parse_gc_message(
+            from_gc(sdk.MultipleObjects(objects_modified=[sdk.MultipleObjectsSingleObject(object_data=bytes(item))]))
+        )
+
+        (modified,) = future.result().objects_modified
+        assert type(modified.object_data) is bytes
+        assert type(base.Item().parse(modified.object_data).attribute[0].value_bytes) is bytes
+
+    asyncio.run(main())
+
+
+def counting_parses(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    parsed: list[Any] = []
+    parse = GCProtobufMessage.parse
+
+    def counting_parse(self: Any, *args: Any) -> Any:
+        parsed.append(msg := parse(self, *args))
+        return msg
+
+    monkeypatch.setattr(GCProtobufMessage, "parse", counting_parse)
+    return parsed
+
+
+CHECK = sdk.SOCacheSubscriptionCheck(owner_soid=sdk.IDOwner(type=1, id=2), version=3)
+
+
+def test_messages_nothing_wants_are_not_parsed(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed = counting_parses(monkeypatch)
+    logged: list[Any] = []
+    monkeypatch.setattr(gc_state.log, "debug", lambda msg, *args, **kwargs: logged.append(args))
+    state: Any = FakeState()
+
+    asyncio.run(state.parse_gc_message(from_gc(CHECK)))
+
+    assert parsed == []
+    [(lazy,)] = logged
+    assert isinstance(lazy, LazyGCMessage)
+    assert repr(lazy) == repr(CHECK)  # it's only parsed if the log is formatted
+    assert len(parsed) == 1
+
+
+def test_listeners_get_the_parsed_message(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed = counting_parses(monkeypatch)
+
+    async def main() -> Any:
+        state: Any = FakeState()
+        future = state.gc_wait_for(sdk.SOCacheSubscriptionCheck, app_id=CSGO.id)
+        await state.parse_gc_message(from_gc(CHECK))
+        return future.result()
+
+    assert asyncio.run(main()) == CHECK
+    assert len(parsed) == 1
+
+
+def test_parsers_get_the_parsed_message() -> None:
+    received: list[Any] = []
+    state: Any = FakeState()
+    state.gc_parsers = {sdk.SOCacheSubscriptionCheck: lambda state, msg: received.append(msg)}
+    state.gc_parser_emsgs = frozenset({CHECK.MSG})
+
+    asyncio.run(state.parse_gc_message(from_gc(CHECK)))
+
+    assert received == [CHECK]
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any
+
+from steam.ext.csgo import InspectCache, InspectPool
+
+URL = "steam://rungame/730/76561202255233023/+csgo_econ_action_preview%20S76561198000000000A123D456"
+
+
+class FakeReady:
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+        self.event.set()
+
+    def is_set(self) -> bool:
+        return self.event.is_set()
+
+
+class FakeState:
+    def __init__(self) -> None:
+        self._gc_ready = FakeReady()
+
+
+class FakeClient:
+    def __init__(self, result: Any = None) -> None:
+        self._state = FakeState()
+        self.result = result
+        self.started = asyncio.Event()
+        self.cancelled = False
+        self.disconnected = asyncio.Event()
+        self.closed = False
+        self.ready_waits = 0
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def wait_for_gc_ready(self) -> None:
+        self.ready_waits += 1
+        await self._state._gc_ready.event.wait()
+
+    async def wait_for(self, event: str) -> None:
+        assert event == "gc_disconnect"
+        await self.disconnected.wait()
+
+    async def _inspect_item(self, **kwargs: Any) -> Any:
+        self.started.set()
+        if self.result is None:  # never answers
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        return self.result
+
+
+def test_retry_moves_to_another_client() -> None:
+    async def main() -> None:
+        dead = FakeClient()
+        alive = FakeClient(result="item")
+        alive._state._gc_ready.event.clear()  # so the first attempt goes to the dead client
+        cache = InspectCache()
+        pool = InspectPool([dead, alive], timeout=5, inspect_cache=cache)
+
+        inspect = asyncio.create_task(pool.inspect(URL))
+        await dead.started.wait()
+        joined = asyncio.create_task(cache.fetch(123, 456, lambda: asyncio.sleep(0, "other")))
+        alive._state._gc_ready.event.set()
+        dead._state._gc_ready.event.clear()
+        dead.disconnected.set()
+
+        assert await asyncio.wait_for(inspect, 1) == "item"
+        assert await asyncio.wait_for(joined, 1) == "item"  # joined the pool's inspect rather than the dead client's
+        assert dead.cancelled
+
+    asyncio.run(main())
+
+
+def test_cancelling_every_waiter_cancels_the_fetch() -> None:
+    async def main() -> None:
+        cache = InspectCache()
+        client = FakeClient()
+        fetch = asyncio.create_task(cache.fetch(1, 2, lambda: client._inspect_item()))
+        await client.started.wait()
+        fetch.cancel()
+        await asyncio.wait((fetch,))
+        await asyncio.sleep(0)
+        assert client.cancelled
+        assert await cache.fetch(1, 2, lambda: asyncio.sleep(0, "new")) == "new"  # a new fetch isn't joined to it
+
+    asyncio.run(main())
+
+
+def test_wait_for_ready_doesnt_spin_on_closed_clients() -> None:
+    async def main() -> None:
+        closed = FakeClient(result="item")
+        closed.closed = True
+        pool = InspectPool([closed])
+        inspect = asyncio.create_task(pool.inspect(URL))
+        await asyncio.sleep(0.05)
+        assert not inspect.done()
+        assert closed.ready_waits == 0
+        pool.add(FakeClient(result="item"))
+        assert await asyncio.wait_for(inspect, 1) == "item"
+
+    asyncio.run(main())
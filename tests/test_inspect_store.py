@@ -0,0 +1,71 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from steam.ext.csgo import InspectStore
+from steam.ext.csgo.backpack import BaseInspectedItem, Paint, Sticker
+from steam.ext.csgo.enums import ItemOrigin, ItemQuality
+
+
+def make_item(id: int = 123) -> BaseInspectedItem:
+    return BaseInspectedItem(
+        id=id,
+        def_index=7,
+        paint=Paint(index=661, seed=412, wear=0.0625),
+        rarity=5,
+        quality=ItemQuality.Unique,
+        kill_eater_score_type=None,
+        kill_eater_value=None,
+        custom_name="",
+        stickers=[Sticker(slot=0, id=5, wear=0.5, rotation=None, scale=None, tint_id=None)],
+        inventory=0,
+        origin=ItemOrigin.Purchased,
+        quest_id=0,
+        drop_reason=0,
+        music_index=0,
+        ent_index=0,
+    )
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    store = InspectStore(tmp_path / "inspect.db")
+    asyncio.run(store.put(456, make_item()))
+    item = asyncio.run(store.get(123, 456))
+    store.close()
+
+    assert item is not None
+    assert item.paint == Paint(index=661, seed=412, wear=0.0625)
+    assert type(item.paint.index) is int and type(item.paint.seed) is int
+    assert item.stickers[0].id == 5
+    assert item.quality == ItemQuality.Unique
+
+
+def test_round_trip_with_large_ids(tmp_path: Path) -> None:
+    asset_id, d = 2**64 - 1, 16009287563399125108  # both are unsigned 64-bit
+    store = InspectStore(tmp_path / "inspect.db")
+    asyncio.run(store.put(d, make_item(asset_id)))
+    item = asyncio.run(store.get(asset_id, d))
+    other = asyncio.run(store.get(asset_id, d - 1))
+    store.close()
+
+    assert item is not None and item.id == asset_id
+    assert other is None
+
+
+def test_paint_is_int_in_stores_with_real_columns(tmp_path: Path) -> None:
+    path = tmp_path / "inspect.db"
+    with sqlite3.connect(path) as connection:  # the schema before paint_index and paint_seed were INTEGER
+        connection.execute(
+            "CREATE TABLE inspected_items (asset_id INTEGER NOT NULL, d INTEGER NOT NULL, "
+            "inspected_at REAL NOT NULL, def_index INTEGER NOT NULL, paint_index REAL NOT NULL, "
+            "paint_seed REAL NOT NULL, paint_wear REAL NOT NULL, stickers TEXT NOT NULL, extra TEXT NOT NULL, "
+            "PRIMARY KEY (asset_id, d)) WITHOUT ROWID"
+        )
+    store = InspectStore(path)
+    asyncio.run(store.put(456, make_item()))
+    item = asyncio.run(store.get(123, 456))
+    store.close()
+
+    assert item is not None
+    assert type(item.paint.index) is int and item.paint.index == 661
+    assert type(item.paint.seed) is int and item.paint.seed == 412
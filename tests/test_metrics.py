@@ -0,0 +1,18 @@
+import os
+import stat
+from pathlib import Path
+
+from steam.ext.csgo import GCMetrics
+
+
+def test_write_prometheus_is_readable_by_others(tmp_path: Path) -> None:
+    metrics = GCMetrics()
+    metrics.message_received(730, 24, 100)
+    path = tmp_path / "steam_gc.prom"
+
+    metrics.write_prometheus(path)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert path.read_text() == metrics.to_prometheus()
+    assert 'steam_gc_messages_received_total{app_id="730",emsg="24"} 1' in path.read_text()
+    assert os.listdir(tmp_path) == ["steam_gc.prom"]
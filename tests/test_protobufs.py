@@ -0,0 +1,63 @@
+from steam.app import CSGO
+from steam.ext.csgo.enums import EMsg
+from steam.ext.csgo.protobufs import base, sdk
+from steam.protobufs import GCProtobufMessage
+
+OWNER = sdk.IDOwner(type=1, id=76561198000000000)
+
+
+def parse_gc(msg: GCProtobufMessage) -> GCProtobufMessage:
+    data = bytes(msg)
+    return GCProtobufMessage().parse(memoryview(data)[4:], msg.MSG, CSGO.id)  # how GCState.parse_gc_message parses
+
+
+def test_welcome_with_caches_round_trip() -> None:
+    items = [
+        bytes(base.Item(id=idx, def_index=7, attribute=[base.ItemAttribute(def_index=6, value=1)])) for idx in range(3)
+    ]
+    welcome = sdk.ClientWelcome(
+        version=1,
+        outofdate_subscribed_caches=[
+            sdk.CacheSubscribed(
+                objects=[sdk.CacheSubscribedSubscribedType(type_id=1, object_data=items)], version=3, owner_soid=OWNER
+            )
+        ],
+        uptodate_subscribed_caches=[sdk.CacheSubscriptionCheck(version=4, owner_soid=OWNER)],
+    )
+
+    parsed = parse_gc(welcome)
+
+    assert isinstance(parsed, sdk.ClientWelcome)
+    assert parsed == welcome
+    (cache,) = parsed.outofdate_subscribed_caches
+    assert type(cache) is sdk.CacheSubscribed
+    assert cache.version == 3 and cache.owner_soid == OWNER
+    assert [base.Item().parse(data).id for data in cache.objects[0].object_data] == [0, 1, 2]
+    (check,) = parsed.uptodate_subscribed_caches
+    assert type(check) is sdk.CacheSubscriptionCheck
+    assert check.version == 4
+
+
+def test_top_level_cache_messages_round_trip() -> None:
+    subscribed = sdk.SOCacheSubscribed(
+        objects=[sdk.CacheSubscribedSubscribedType(type_id=1, object_data=[bytes(base.Item(id=1))])],
+        version=5,
+        owner_soid=OWNER,
+    )
+    check = sdk.SOCacheSubscriptionCheck(version=6, owner_soid=OWNER)
+    refresh = sdk.SOCacheSubscriptionRefresh(owner_soid=OWNER)
+
+    assert subscribed.MSG == EMsg.SOCacheSubscribed
+    for msg in (subscribed, check, refresh):
+        parsed = parse_gc(msg)
+        assert type(parsed) is type(msg)
+        assert parsed == msg
+
+
+def test_metadata_is_per_class() -> None:
+    GCProtobufMessage()._betterproto  # e.g. the repr of an unknown message
+    assert "_betterproto" not in GCProtobufMessage.__dict__  # only this package's messages are changed
+    subscribed = sdk.SOCacheSubscribed(version=1, owner_soid=OWNER)
+    assert parse_gc(subscribed) == subscribed
+    assert sdk.SOCacheSubscribed._betterproto.field_name_by_number[3] == "version"
+    assert sdk.SOCacheSubscriptionCheck._betterproto.field_name_by_number[2] == "version"
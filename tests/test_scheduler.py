@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from steam._gc.scheduler import GCSendScheduler, SendPriority
+
+
+class Msg:
+    pass
+
+
+class Slow(Msg):
+    pass
+
+
+def test_close_cancels_waiting_sends() -> None:
+    async def main() -> None:
+        sent: list[Any] = []
+
+        async def send(msg: Any) -> None:
+            if isinstance(msg, Slow):
+                await asyncio.Event().wait()  # a write that never finishes
+            sent.append(msg)
+
+        scheduler = GCSendScheduler(send, lambda app: None, priorities={}, rates={})  # type: ignore
+        sending = asyncio.create_task(scheduler.send(Slow()))  # type: ignore
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(scheduler.send(Msg(), priority=SendPriority.Low)) for _ in range(3)  # type: ignore
+        ]
+        await asyncio.sleep(0)
+
+        scheduler.close()
+        done, pending = await asyncio.wait([sending, *queued], timeout=1)
+
+        assert not pending
+        assert all(task.cancelled() for task in done)
+        assert not sent
+
+    asyncio.run(main())
+
+
+def test_sends_in_priority_order() -> None:
+    async def main() -> None:
+        sent: list[SendPriority] = []
+
+        async def send(msg: Any) -> None:
+            sent.append(msg)
+
+        scheduler = GCSendScheduler(send, lambda app: None, priorities={}, rates={})  # type: ignore
+        tasks = [
+            asyncio.create_task(scheduler.send(priority, priority=priority))  # type: ignore
+            for priority in (SendPriority.Low, SendPriority.Normal, SendPriority.Critical)
+        ]
+        await asyncio.gather(*tasks)
+        scheduler.close()
+
+        assert sent == [SendPriority.Critical, SendPriority.Normal, SendPriority.Low]
+
+    asyncio.run(main())
+
+
+def test_sends_after_close_are_rejected_until_reopened() -> None:
+    async def main() -> None:
+        sent: list[Any] = []
+
+        async def send(msg: Any) -> None:
+            sent.append(msg)
+
+        scheduler = GCSendScheduler(send, lambda app: None, priorities={}, rates={})  # type: ignore
+        scheduler.close()
+
+        with pytest.raises(RuntimeError):
+            await scheduler.send(Msg())  # type: ignore
+        assert scheduler._worker is None
+        assert not sent
+
+        scheduler.reopen()
+        await scheduler.send(Msg())  # type: ignore
+        assert len(sent) == 1
+        scheduler.close()
+
+    asyncio.run(main())
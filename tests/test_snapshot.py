@@ -0,0 +1,103 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from helpers import OWNER_ID64, make_item, make_state
+
+from steam.ext.csgo.client import Client
+from steam.ext.csgo.protobufs import base, sdk
+from steam.ext.csgo.snapshot import BackpackSnapshot
+from steam.trade import Inventory
+
+OWNER = sdk.IDOwner(type=1, id=OWNER_ID64)
+INVENTORY: Any = {
+    "assets": [{"assetid": str(id), "classid": "1", "instanceid": "2"} for id in (1, 2)],
+    "descriptions": [{"classid": "1", "instanceid": "2", "name": "AK-47"}],
+    "total_inventory_count": 2,
+}
+
+
+def make_snapshot(owner_id64: int = OWNER_ID64) -> BackpackSnapshot:
+    return BackpackSnapshot(
+        owner_id64=owner_id64,
+        so_cache_versions={(1, owner_id64): 5},
+        inventory=INVENTORY,
+        items=[base.Item(id=1, def_index=7, inventory=3), base.Item(id=2, def_index=7, inventory=4)],
+    )
+
+
+@pytest.fixture
+def inventory(monkeypatch: pytest.MonkeyPatch) -> None:
+    # build inventories from a web inventory's JSON like the steam.py this extension targets does
+    def __init__(self: Any, state: Any, data: Any, owner: Any, app: Any, language: Any) -> None:
+        self._state, self.owner, self.app, self._language = state, owner, app, language
+        self._update(data)
+
+    def _update(self: Any, data: Any) -> None:
+        self.items = [make_item(int(asset["assetid"])) for asset in data["assets"]]
+
+    monkeypatch.setattr(Inventory, "__init__", __init__)
+    monkeypatch.setattr(Inventory, "_update", _update)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "snapshots" / "backpack.json"
+    make_snapshot().dump(path)
+
+    assert BackpackSnapshot.load(path) == make_snapshot()
+
+
+def test_unusable_snapshots_are_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "backpack.json"
+    assert BackpackSnapshot.load(path) is None
+    path.write_text("{")
+    assert BackpackSnapshot.load(path) is None
+    path.write_text('{"version": 0}')
+    assert BackpackSnapshot.load(path) is None
+
+
+def test_the_backpack_is_restored_before_the_welcome_is_handled(inventory: None) -> None:
+    state = make_state(_gc_ready=SimpleNamespace(is_set=lambda: True), _backpack_snapshot=make_snapshot())
+    state.backpack = None
+    welcome = sdk.ClientWelcome(uptodate_subscribed_caches=[sdk.CacheSubscriptionCheck(owner_soid=OWNER, version=5)])
+
+    asyncio.run(state.parse_gc_client_connect(welcome))
+
+    assert [(item.id, item.position) for item in state.backpack] == [(1, 3), (2, 4)]
+    assert state.backpack._data is INVENTORY
+    assert state._backpack_snapshot is None
+
+
+def test_another_accounts_snapshot_is_ignored(inventory: None) -> None:
+    other = OWNER_ID64 + 1
+    state = make_state(so_cache_versions={(1, other): 5})
+    state.backpack = None
+
+    asyncio.run(state._restore_backpack_snapshot(make_snapshot(other)))
+
+    assert state.backpack is None
+    assert state.so_cache_versions == {}  # so the GC sends the whole cache
+
+
+def test_the_snapshot_is_saved_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "backpack.json"
+    state = make_state(backpack_snapshot_path=path, so_cache_versions={(1, OWNER_ID64): 6})
+    state.gc_sender = SimpleNamespace(close=lambda: None)
+    state.backpack._data = INVENTORY
+    for id in (1, 2):
+        state.backpack._add_item(make_item(id))
+    asyncio.run(state.update_backpack(base.Item(id=1, def_index=7, inventory=3)))  # 2 was never merged
+    client: Any = Client.__new__(Client)
+    client._state = state
+    client._closed = True  # nothing to disconnect from
+
+    asyncio.run(client.close())
+
+    snapshot = BackpackSnapshot.load(path)
+    assert snapshot is not None
+    assert snapshot.owner_id64 == OWNER_ID64
+    assert snapshot.so_cache_versions == {(1, OWNER_ID64): 6}
+    assert [(item.id, item.inventory) for item in snapshot.items] == [(1, 3)]
+    assert [asset["assetid"] for asset in snapshot.inventory["assets"]] == ["1"]
@@ -0,0 +1,68 @@
+import asyncio
+
+from helpers import OWNER_ID64, make_item, make_state
+
+from steam._gc.state import MultiEvent
+from steam.ext.csgo.protobufs import base, sdk
+
+OWNER = sdk.IDOwner(type=1, id=OWNER_ID64)
+
+
+def item_cache(*ids: int) -> list[sdk.CacheSubscribedSubscribedType]:
+    return [sdk.CacheSubscribedSubscribedType(type_id=1, object_data=[bytes(base.Item(id=id)) for id in ids])]
+
+
+def test_versions_follow_subscriptions_and_updates() -> None:
+    state = make_state()
+    state.backpack._add_item(make_item(1))
+
+    async def main() -> None:
+        await state.handle_cache_subscribed(sdk.SOCacheSubscribed(objects=item_cache(1), owner_soid=OWNER, version=5))
+        assert state.so_cache_versions == {(1, OWNER_ID64): 5}
+
+        modified = sdk.MultipleObjectsSingleObject(type_id=1, object_data=bytes(base.Item(id=1, inventory=3)))
+        await state.handle_so_update_multiple(
+            sdk.MultipleObjects(objects_modified=[modified], owner_soid=OWNER, version=6)
+        )
+        assert state.so_cache_versions == {(1, OWNER_ID64): 6}
+
+        await state.handle_so_update_multiple(sdk.MultipleObjects(objects_modified=[modified], owner_soid=OWNER))
+        assert state.so_cache_versions == {(1, OWNER_ID64): 6}  # no version doesn't clear it
+
+    asyncio.run(main())
+
+
+def test_welcome_records_up_to_date_caches() -> None:
+    state = make_state(_gc_ready=MultiEvent(1))
+    other = sdk.IDOwner(type=3, id=1)
+    welcome = sdk.ClientWelcome(
+        outofdate_subscribed_caches=[sdk.CacheSubscribed(objects=[], owner_soid=OWNER, version=8)],
+        uptodate_subscribed_caches=[sdk.CacheSubscriptionCheck(owner_soid=other, version=2)],
+    )
+
+    asyncio.run(state.parse_gc_client_connect(welcome))
+
+    assert state.so_cache_versions == {(1, OWNER_ID64): 8, (3, 1): 2}
+    assert ("gc_ready",) in state.dispatched
+
+
+def test_versions_are_sent_in_the_hello() -> None:
+    state = make_state(so_cache_versions={(1, OWNER_ID64): 5, (3, 1): 2})
+
+    hello = state._get_gc_message()
+
+    assert isinstance(hello, sdk.ClientHello)
+    assert {(have.soid.type, have.soid.id, have.version) for have in hello.socache_have_versions} == {
+        (1, OWNER_ID64, 5),
+        (3, 1, 2),
+    }
+
+
+def test_up_to_date_subscription_check_skips_the_refresh() -> None:
+    state = make_state(so_cache_versions={(1, OWNER_ID64): 5})
+
+    asyncio.run(state.handle_cache_subscription_check(sdk.SOCacheSubscriptionCheck(owner_soid=OWNER, version=5)))
+    assert state.sent == []
+
+    asyncio.run(state.handle_cache_subscription_check(sdk.SOCacheSubscriptionCheck(owner_soid=OWNER, version=6)))
+    assert state.sent == [sdk.SOCacheSubscriptionRefresh(owner_soid=OWNER)]
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any
+
+from helpers import OWNER_ID64, make_item, make_state
+
+from steam.ext.csgo.protobufs import base, sdk
+
+OWNER = sdk.IDOwner(type=1, id=OWNER_ID64)
+
+
+def make_updating_state(*ids: int) -> Any:
+    state = make_state()
+    for id in ids:
+        item = make_item(id)
+        item.position = id
+        item.custom_name = None
+        state.backpack._add_item(item)
+    return state
+
+
+def modified(id: int, **fields: Any) -> sdk.MultipleObjectsSingleObject:
+    return sdk.MultipleObjectsSingleObject(type_id=1, object_data=bytes(base.Item(id=id, def_index=7, **fields)))
+
+
+def test_a_batch_is_dispatched_once() -> None:
+    state = make_updating_state(1, 2, 3)
+    msg = sdk.MultipleObjects(
+        objects_modified=[modified(1, inventory=10), modified(2, inventory=20), modified(99)],
+        version=7,
+        owner_soid=OWNER,
+    )
+
+    asyncio.run(state.handle_so_update_multiple(msg))
+
+    updates = [tuple(args) for event, *args in state.dispatched if event == "item_update"]
+    assert [(before.position, after.position) for before, after in updates] == [(1, 10), (2, 20)]
+    assert all(before is not after and after is state.backpack.get_item(after.id) for before, after in updates)
+    [batch] = [args for event, *args in state.dispatched if event == "item_update_many"]
+    assert batch == [updates]
+    assert state.so_cache_versions == {(1, OWNER_ID64): 7}
+
+
+def test_a_single_update_keeps_the_old_item() -> None:
+    state = make_updating_state(1)
+    data = bytes(
+        base.Item(
+            id=1, def_index=7, inventory=4, attribute=[base.ItemAttribute(def_index=111, value_bytes=b"\0\4name")]
+        )
+    )
+
+    asyncio.run(state.handle_so_update(sdk.SOUpdate(type_id=1, object_data=data, version=8, owner_soid=OWNER)))
+
+    [(event, before, after)] = [args for args in state.dispatched if args[0] == "item_update"]
+    assert (before.position, before.custom_name) == (1, None)
+    assert (after.position, after.custom_name) == (4, "name")
@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from steam.ext.csgo.attributes import copy_fields
+from steam.ext.csgo.protobufs import base
+from steam.ext.csgo.state import GCState
+
+
+class FakeBackpack:
+    def __init__(self, items: Any = ()) -> None:
+        self.items = {item.id: item for item in items}
+
+    def get_item(self, id: int) -> Any:
+        return self.items.get(id)
+
+    def _add_item(self, item: Any) -> None:
+        self.items[item.id] = item
+
+    def _remove_item(self, item: Any) -> None:
+        del self.items[item.id]
+
+
+class FakeCasketItems(set[int]):
+    def _remove(self, asset_id: int) -> None:
+        self.remove(asset_id)
+
+
+class FakeState:
+    def __init__(self, casket_items: Any = ()) -> None:
+        self.client = SimpleNamespace(wait_until_ready=lambda: asyncio.sleep(0))
+        self.backpack = FakeBackpack()
+        self.casket_items = FakeCasketItems(casket_items)
+        self.waiting_for_casket_items: dict[int, Any] = {}
+        self.fetching = 0
+        self.max_fetching = 0
+
+    async def fetch_created_item(self, asset_id: int) -> Any:
+        self.fetching += 1
+        self.max_fetching = max(self.max_fetching, self.fetching)
+        await asyncio.sleep(0.01)
+        self.fetching -= 1
+        return SimpleNamespace(id=asset_id)
+
+    def add_item_to_backpack(self, item: Any) -> None:
+        self.backpack._add_item(item)
+
+
+def test_items_removed_from_caskets_are_fetched_together() -> None:
+    state = FakeState(casket_items=range(1, 6))
+    gc_items = [base.Item(id=id, def_index=7, inventory=id) for id in range(1, 6)]
+
+    asyncio.run(GCState.update_backpack(state, *gc_items))  # type: ignore
+
+    assert state.max_fetching == 5
+    assert not state.casket_items
+    assert sorted(state.backpack.items) == [1, 2, 3, 4, 5]
+    assert state.backpack.items[3].position == 3
+
+
+def test_copy_fields_matches_getattr() -> None:
+    gc_item = base.Item().parse(bytes(base.Item(id=1, def_index=7, custom_name="name")))
+    first, second = SimpleNamespace(), SimpleNamespace()
+
+    copy_fields(first, gc_item)  # type: ignore
+    copy_fields(second, gc_item)  # type: ignore
+
+    assert vars(first) == {name: getattr(gc_item, name) for name in base.Item.__annotations__}
+    assert first.interior_item == base.Item() and first.interior_item is not second.interior_item
+    assert first.attribute == [] and first.attribute is not second.attribute